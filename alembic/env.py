@@ -1,5 +1,4 @@
 from logging.config import fileConfig
-from sqlalchemy import engine_from_config, pool
 from alembic import context
 import os
 import sys
@@ -7,54 +6,55 @@ import sys
 # Add the parent directory to the path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from app.database import Base
-from app.models import match, upcoming, finance
+from app.database import Base, sync_database_url
+from app.migrate import migration_engine
+from app.models import match, upcoming, finance, notification
 
 # this is the Alembic Config object
 config = context.config
 
-# Interpret the config file for Python logging
-if config.config_file_name is not None:
+# Interpret the config file for Python logging, unless app.migrate is
+# running us inside the application's process
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
 target_metadata = Base.metadata
 
-def get_url():
-    # Override the URL from environment if available
-    return os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./cricket_club.db")
-
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
-    url = get_url()
     context.configure(
-        url=url,
+        url=sync_database_url(),
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
     )
 
     with context.begin_transaction():
         context.run_migrations()
 
-def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
-    configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = get_url()
-    
-    connectable = engine_from_config(
-        configuration,
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+def do_run_migrations(connection) -> None:
+    # Batch mode rebuilds SQLite tables for ALTERs it can't do in place
+    context.configure(
+        connection=connection, target_metadata=target_metadata, render_as_batch=True
     )
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
+    with context.begin_transaction():
+        context.run_migrations()
 
-        with context.begin_transaction():
-            context.run_migrations()
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode."""
+    # app.migrate passes its open connection so stamping and upgrading share
+    # one transaction
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    connectable = migration_engine()
+    with connectable.begin() as connection:
+        do_run_migrations(connection)
 
 if context.is_offline_mode():
     run_migrations_offline()
@@ -0,0 +1,176 @@
+"""baseline schema
+
+The tables as create_all built them before migrations were introduced.
+Databases created back then are stamped at this revision by app.migrate.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _timestamps(updated: bool = True):
+    columns = [sa.Column("created_at", sa.DateTime(), nullable=False)]
+    if updated:
+        columns.append(sa.Column("updated_at", sa.DateTime(), nullable=False))
+    return columns
+
+
+def upgrade() -> None:
+    op.create_table(
+        "finance_periods",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("label", sa.String(100), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("notes", sa.Text()),
+        *_timestamps(),
+    )
+    op.create_table(
+        "matches",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("team_a_name", sa.String(100), nullable=False),
+        sa.Column("team_b_name", sa.String(100), nullable=False),
+        sa.Column("total_overs", sa.Integer(), nullable=False),
+        sa.Column("venue", sa.String(200)),
+        sa.Column("toss_winner", sa.String(100)),
+        sa.Column("toss_decision", sa.String(10)),
+        sa.Column(
+            "status",
+            sa.Enum("TOSS", "IN_PROGRESS", "INNINGS_BREAK", "COMPLETED", "ABANDONED", name="matchstatus"),
+            nullable=False,
+        ),
+        sa.Column("result_summary", sa.Text()),
+        *_timestamps(),
+    )
+    op.create_table(
+        "upcoming_matches",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("opponent_name", sa.String(100), nullable=False),
+        sa.Column("match_date", sa.DateTime(), nullable=False),
+        sa.Column("venue", sa.String(200)),
+        sa.Column("overs", sa.Integer()),
+        sa.Column("notes", sa.Text()),
+        *_timestamps(),
+    )
+    op.create_table(
+        "finance_entries",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column(
+            "period_id", sa.String(36),
+            sa.ForeignKey("finance_periods.id", ondelete="CASCADE"), nullable=False,
+        ),
+        sa.Column("entry_type", sa.Enum("INCOME", "EXPENSE", name="entrytype"), nullable=False),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("amount", sa.Numeric(12, 2), nullable=False),
+        sa.Column("date", sa.DateTime(), nullable=False),
+        *_timestamps(),
+    )
+    op.create_table(
+        "innings",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column(
+            "match_id", sa.String(36),
+            sa.ForeignKey("matches.id", ondelete="CASCADE"), nullable=False,
+        ),
+        sa.Column("innings_number", sa.Integer(), nullable=False),
+        sa.Column("batting_team", sa.String(100), nullable=False),
+        sa.Column("bowling_team", sa.String(100), nullable=False),
+        sa.Column("total_runs", sa.Integer(), nullable=False),
+        sa.Column("total_wickets", sa.Integer(), nullable=False),
+        sa.Column("total_overs_bowled", sa.Float(), nullable=False),
+        sa.Column("extras_wides", sa.Integer(), nullable=False),
+        sa.Column("extras_no_balls", sa.Integer(), nullable=False),
+        sa.Column("extras_byes", sa.Integer(), nullable=False),
+        sa.Column("extras_leg_byes", sa.Integer(), nullable=False),
+        sa.Column("extras_penalties", sa.Integer(), nullable=False),
+        sa.Column("target", sa.Integer()),
+        sa.Column(
+            "status",
+            sa.Enum("NOT_STARTED", "IN_PROGRESS", "COMPLETED", name="inningsstatus"),
+            nullable=False,
+        ),
+        sa.Column("current_over", sa.Integer(), nullable=False),
+        sa.Column("current_ball", sa.Integer(), nullable=False),
+        sa.Column("striker_name", sa.String(100)),
+        sa.Column("non_striker_name", sa.String(100)),
+        sa.Column("current_bowler_name", sa.String(100)),
+        *_timestamps(updated=False),
+    )
+    op.create_table(
+        "player_availabilities",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column(
+            "upcoming_match_id", sa.String(36),
+            sa.ForeignKey("upcoming_matches.id", ondelete="CASCADE"), nullable=False,
+        ),
+        sa.Column("player_name", sa.String(100), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("AVAILABLE", "NOT_AVAILABLE", "MAYBE", name="availabilitystatus"),
+            nullable=False,
+        ),
+        sa.Column("device_fingerprint", sa.String(255), nullable=False),
+        *_timestamps(),
+    )
+    op.create_table(
+        "ball_events",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column(
+            "innings_id", sa.String(36),
+            sa.ForeignKey("innings.id", ondelete="CASCADE"), nullable=False,
+        ),
+        sa.Column("sequence_number", sa.Integer(), nullable=False),
+        sa.Column("over_number", sa.Integer(), nullable=False),
+        sa.Column("ball_number", sa.Integer(), nullable=False),
+        sa.Column("bowler_name", sa.String(100), nullable=False),
+        sa.Column("batsman_name", sa.String(100), nullable=False),
+        sa.Column("non_striker_name", sa.String(100), nullable=False),
+        sa.Column("runs_scored", sa.Integer(), nullable=False),
+        sa.Column("is_boundary_four", sa.Boolean(), nullable=False),
+        sa.Column("is_boundary_six", sa.Boolean(), nullable=False),
+        sa.Column(
+            "extra_type",
+            sa.Enum("NONE", "WIDE", "NO_BALL", "BYE", "LEG_BYE", "PENALTY", name="extratype"),
+            nullable=False,
+        ),
+        sa.Column("extra_runs", sa.Integer(), nullable=False),
+        sa.Column("is_wicket", sa.Boolean(), nullable=False),
+        sa.Column(
+            "dismissal_type",
+            sa.Enum(
+                "BOWLED", "CAUGHT", "LBW", "RUN_OUT", "STUMPED", "HIT_WICKET",
+                "RETIRED_HURT", "OBSTRUCTING", "TIMED_OUT", "HANDLED_BALL",
+                name="dismissaltype",
+            ),
+        ),
+        sa.Column("dismissed_batsman", sa.String(100)),
+        sa.Column("fielder_name", sa.String(100)),
+        sa.Column("is_legal_delivery", sa.Boolean(), nullable=False),
+        sa.Column("is_undone", sa.Boolean(), nullable=False),
+        *_timestamps(updated=False),
+    )
+
+
+def downgrade() -> None:
+    for table in (
+        "ball_events", "player_availabilities", "innings", "finance_entries",
+        "upcoming_matches", "matches", "finance_periods",
+    ):
+        op.drop_table(table)
+    for enum in (
+        "dismissaltype", "extratype", "availabilitystatus", "inningsstatus",
+        "entrytype", "matchstatus",
+    ):
+        sa.Enum(name=enum).drop(op.get_bind(), checkfirst=True)
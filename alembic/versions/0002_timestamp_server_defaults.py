@@ -0,0 +1,44 @@
+"""timestamp server defaults
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = {
+    "matches": ("created_at", "updated_at"),
+    "innings": ("created_at",),
+    "ball_events": ("created_at",),
+    "upcoming_matches": ("created_at", "updated_at"),
+    "player_availabilities": ("created_at", "updated_at"),
+    "finance_periods": ("created_at", "updated_at"),
+    "finance_entries": ("created_at", "updated_at"),
+}
+
+
+def _set_defaults(server_default) -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column, existing_type=sa.DateTime(), existing_nullable=False,
+                    server_default=server_default,
+                )
+
+
+def upgrade() -> None:
+    _set_defaults(sa.func.now())
+
+
+def downgrade() -> None:
+    _set_defaults(None)
@@ -0,0 +1,94 @@
+"""binary uuid keys
+
+String(36) ids and foreign keys become native UUID on PostgreSQL and
+16-byte blobs elsewhere, matching app.models.types.GUID.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Each table's foreign key column and the table it references
+TABLES = {
+    "matches": None,
+    "upcoming_matches": None,
+    "finance_periods": None,
+    "innings": ("match_id", "matches"),
+    "ball_events": ("innings_id", "innings"),
+    "player_availabilities": ("upcoming_match_id", "upcoming_matches"),
+    "finance_entries": ("period_id", "finance_periods"),
+}
+
+
+def _key_columns(table):
+    foreign_key = TABLES[table]
+    return ("id",) if foreign_key is None else ("id", foreign_key[0])
+
+
+def _alter_postgresql(new_type, using) -> None:
+    inspector = sa.inspect(op.get_bind())
+    foreign_keys = {}
+    for table, foreign_key in TABLES.items():
+        if foreign_key is not None:
+            fk = inspector.get_foreign_keys(table)[0]
+            foreign_keys[table] = fk
+            op.drop_constraint(fk["name"], table, type_="foreignkey")
+    for table in TABLES:
+        for column in _key_columns(table):
+            op.alter_column(
+                table, column, type_=new_type, postgresql_using=using.format(column=column)
+            )
+    for table, fk in foreign_keys.items():
+        op.create_foreign_key(
+            fk["name"], table, fk["referred_table"],
+            fk["constrained_columns"], fk["referred_columns"], ondelete="CASCADE",
+        )
+
+
+def _rewrite_sqlite(new_type, convert) -> None:
+    # Values are rewritten here rather than by the batch copy, which would
+    # CAST them and BINARY(16) has numeric affinity in SQLite
+    conn = op.get_bind()
+    for table in TABLES:
+        for column in _key_columns(table):
+            rows = conn.execute(sa.text(f"SELECT DISTINCT {column} FROM {table}")).scalars().all()
+            if rows:
+                conn.execute(
+                    sa.text(f"UPDATE {table} SET {column} = :new WHERE {column} = :old"),
+                    [{"old": value, "new": convert(value)} for value in rows],
+                )
+        reflect_args = [sa.Column("id", new_type, primary_key=True)]
+        if TABLES[table] is not None:
+            fk_column, parent = TABLES[table]
+            reflect_args.append(sa.Column(
+                fk_column, new_type,
+                sa.ForeignKey(f"{parent}.id", ondelete="CASCADE"), nullable=False,
+            ))
+        with op.batch_alter_table(table, recreate="always", reflect_args=reflect_args):
+            pass
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _alter_postgresql(postgresql.UUID(as_uuid=True), "{column}::uuid")
+    else:
+        _rewrite_sqlite(sa.BINARY(16), lambda value: uuid.UUID(value).bytes)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _alter_postgresql(sa.String(36), "{column}::text")
+    else:
+        _rewrite_sqlite(sa.String(36), lambda value: str(uuid.UUID(bytes=value)))
@@ -0,0 +1,27 @@
+"""lookup indexes
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_innings_match_num", "innings", ["match_id", "innings_number"])
+    op.create_index("ix_ball_events_innings_seq", "ball_events", ["innings_id", "sequence_number"])
+    op.create_index("ix_finance_entries_period_date", "finance_entries", ["period_id", "date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_finance_entries_period_date", table_name="finance_entries")
+    op.drop_index("ix_ball_events_innings_seq", table_name="ball_events")
+    op.drop_index("ix_innings_match_num", table_name="innings")
@@ -0,0 +1,90 @@
+"""store enums as short codes
+
+Enum columns held the member names (native enum types on PostgreSQL);
+app.models.types.CodedEnum stores two-character codes instead.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copies of the model code maps: later edits to the models must not
+# change what this revision writes
+MATCH_STATUS = {
+    "TOSS": "ts", "IN_PROGRESS": "ip", "INNINGS_BREAK": "ib",
+    "COMPLETED": "co", "ABANDONED": "ab",
+}
+INNINGS_STATUS = {"NOT_STARTED": "ns", "IN_PROGRESS": "ip", "COMPLETED": "co"}
+EXTRA_TYPE = {
+    "NONE": "-", "WIDE": "w", "NO_BALL": "nb", "BYE": "b", "LEG_BYE": "lb", "PENALTY": "p",
+}
+DISMISSAL_TYPE = {
+    "BOWLED": "b", "CAUGHT": "c", "LBW": "lb", "RUN_OUT": "ro", "STUMPED": "st",
+    "HIT_WICKET": "hw", "RETIRED_HURT": "rh", "OBSTRUCTING": "of", "TIMED_OUT": "to",
+    "HANDLED_BALL": "hb",
+}
+AVAILABILITY_STATUS = {"AVAILABLE": "y", "NOT_AVAILABLE": "n", "MAYBE": "m"}
+ENTRY_TYPE = {"INCOME": "in", "EXPENSE": "ex"}
+
+# (table, column, nullable, enum type name, codes)
+COLUMNS = (
+    ("matches", "status", False, "matchstatus", MATCH_STATUS),
+    ("innings", "status", False, "inningsstatus", INNINGS_STATUS),
+    ("ball_events", "extra_type", False, "extratype", EXTRA_TYPE),
+    ("ball_events", "dismissal_type", True, "dismissaltype", DISMISSAL_TYPE),
+    ("player_availabilities", "status", False, "availabilitystatus", AVAILABILITY_STATUS),
+    ("finance_entries", "entry_type", False, "entrytype", ENTRY_TYPE),
+)
+
+
+def _case(column, mapping) -> str:
+    whens = " ".join(f"WHEN '{old}' THEN '{new}'" for old, new in mapping.items())
+    return f"CASE {column} {whens} END"
+
+
+def upgrade() -> None:
+    postgresql = op.get_bind().dialect.name == "postgresql"
+    for table, column, nullable, enum_name, codes in COLUMNS:
+        if postgresql:
+            op.alter_column(
+                table, column, type_=sa.String(2),
+                postgresql_using=_case(f"{column}::text", codes),
+            )
+            op.execute(f"DROP TYPE {enum_name}")
+        else:
+            op.execute(f"UPDATE {table} SET {column} = {_case(column, codes)}")
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.alter_column(
+                    column, type_=sa.String(2), existing_type=sa.String(13),
+                    existing_nullable=nullable,
+                )
+
+
+def downgrade() -> None:
+    postgresql = op.get_bind().dialect.name == "postgresql"
+    for table, column, nullable, enum_name, codes in COLUMNS:
+        names = {code: name for name, code in codes.items()}
+        if postgresql:
+            enum = sa.Enum(*codes, name=enum_name)
+            enum.create(op.get_bind(), checkfirst=True)
+            op.alter_column(
+                table, column, type_=enum,
+                postgresql_using=f"({_case(column, names)})::{enum_name}",
+            )
+        else:
+            op.execute(f"UPDATE {table} SET {column} = {_case(column, names)}")
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.alter_column(
+                    column, type_=sa.String(max(map(len, codes))),
+                    existing_type=sa.String(2), existing_nullable=nullable,
+                )
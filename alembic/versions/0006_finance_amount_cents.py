@@ -0,0 +1,32 @@
+"""finance amounts in integer cents
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("finance_entries", sa.Column("amount_cents", sa.BigInteger(), nullable=True))
+    op.execute("UPDATE finance_entries SET amount_cents = CAST(ROUND(amount * 100) AS BIGINT)")
+    with op.batch_alter_table("finance_entries") as batch_op:
+        batch_op.alter_column("amount_cents", existing_type=sa.BigInteger(), nullable=False)
+        batch_op.drop_column("amount")
+
+
+def downgrade() -> None:
+    op.add_column("finance_entries", sa.Column("amount", sa.Numeric(12, 2), nullable=True))
+    op.execute("UPDATE finance_entries SET amount = amount_cents / 100.0")
+    with op.batch_alter_table("finance_entries") as batch_op:
+        batch_op.alter_column("amount", existing_type=sa.Numeric(12, 2), nullable=False)
+        batch_op.drop_column("amount_cents")
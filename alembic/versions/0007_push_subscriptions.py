@@ -0,0 +1,30 @@
+"""push subscriptions table
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "push_subscriptions",
+        sa.Column("endpoint", sa.String(1024), primary_key=True),
+        sa.Column("p256dh", sa.String(255), nullable=False),
+        sa.Column("auth", sa.String(255), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("push_subscriptions")
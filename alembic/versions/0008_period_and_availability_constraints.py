@@ -0,0 +1,55 @@
+"""unique finance period per month; upcoming match indexes
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The old check-then-insert could race into two periods for one month:
+    # move their entries to the oldest period and drop the rest
+    op.execute(
+        """
+        UPDATE finance_entries SET period_id = (
+            SELECT keep.id FROM finance_periods keep
+            JOIN finance_periods p ON keep.year = p.year AND keep.month = p.month
+            WHERE p.id = finance_entries.period_id
+            ORDER BY keep.created_at, keep.id
+            LIMIT 1
+        )
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM finance_periods WHERE EXISTS (
+            SELECT 1 FROM finance_periods keep
+            WHERE keep.year = finance_periods.year AND keep.month = finance_periods.month
+            AND (keep.created_at < finance_periods.created_at
+                 OR (keep.created_at = finance_periods.created_at AND keep.id < finance_periods.id))
+        )
+        """
+    )
+    with op.batch_alter_table("finance_periods") as batch_op:
+        batch_op.create_unique_constraint("uq_period_year_month", ["year", "month"])
+    op.create_index("ix_upcoming_matches_match_date", "upcoming_matches", ["match_date"])
+    op.create_index(
+        "ix_player_availabilities_match_device", "player_availabilities",
+        ["upcoming_match_id", "device_fingerprint"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_player_availabilities_match_device", table_name="player_availabilities")
+    op.drop_index("ix_upcoming_matches_match_date", table_name="upcoming_matches")
+    with op.batch_alter_table("finance_periods") as batch_op:
+        batch_op.drop_constraint("uq_period_year_month", type_="unique")
@@ -0,0 +1,36 @@
+"""innings active ball counter
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "innings",
+        sa.Column("active_ball_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE innings SET active_ball_count = (
+            SELECT COUNT(*) FROM ball_events
+            WHERE ball_events.innings_id = innings.id AND ball_events.is_undone = false
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("innings") as batch_op:
+        batch_op.drop_column("active_ball_count")
@@ -0,0 +1,45 @@
+"""one availability row per device and match
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recreate_index(unique: bool) -> None:
+    op.drop_index("ix_player_availabilities_match_device", table_name="player_availabilities")
+    op.create_index(
+        "ix_player_availabilities_match_device", "player_availabilities",
+        ["upcoming_match_id", "device_fingerprint"], unique=unique,
+    )
+
+
+def upgrade() -> None:
+    # Racing submissions could leave several rows for one device; keep the
+    # most recently updated one
+    op.execute(
+        """
+        DELETE FROM player_availabilities WHERE EXISTS (
+            SELECT 1 FROM player_availabilities newer
+            WHERE newer.upcoming_match_id = player_availabilities.upcoming_match_id
+            AND newer.device_fingerprint = player_availabilities.device_fingerprint
+            AND (newer.updated_at > player_availabilities.updated_at
+                 OR (newer.updated_at = player_availabilities.updated_at
+                     AND newer.id > player_availabilities.id))
+        )
+        """
+    )
+    _recreate_index(unique=True)
+
+
+def downgrade() -> None:
+    _recreate_index(unique=False)
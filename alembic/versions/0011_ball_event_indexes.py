@@ -0,0 +1,31 @@
+"""ball event lookup indexes
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_ball_events_innings_active_seq", "ball_events",
+        ["innings_id", "is_undone", "sequence_number"],
+    )
+    op.create_index(
+        "ix_ball_events_innings_over_ball", "ball_events",
+        ["innings_id", "over_number", "ball_number"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ball_events_innings_over_ball", table_name="ball_events")
+    op.drop_index("ix_ball_events_innings_active_seq", table_name="ball_events")
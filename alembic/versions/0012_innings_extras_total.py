@@ -0,0 +1,39 @@
+"""innings extras total as a stored generated column
+
+SQLite can't ADD COLUMN a STORED generated column, so there the table is
+rebuilt with it.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-15
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recreate() -> str:
+    return "always" if op.get_bind().dialect.name == "sqlite" else "auto"
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("innings", recreate=_recreate()) as batch_op:
+        batch_op.add_column(sa.Column(
+            "extras_total", sa.Integer(),
+            sa.Computed(
+                "extras_wides + extras_no_balls + extras_byes + extras_leg_byes + extras_penalties",
+                persisted=True,
+            ),
+        ))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("innings", recreate=_recreate()) as batch_op:
+        batch_op.drop_column("extras_total")
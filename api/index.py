@@ -1,9 +1,29 @@
+import asyncio
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from app.main import app
-from fastapi import FastAPI
-from mangum import Mangum
+# app.main (routers, models, logging, DB engine) is imported on the first
+# invocation rather than at module import, then reused by warm invocations.
+_handler = None
 
-handler = Mangum(app)
+
+def _get_handler():
+    global _handler
+    if _handler is None:
+        from mangum import Mangum
+        from app.main import app, check_database
+        _handler = Mangum(app)
+        # Open the first pooled connection on the loop Mangum will reuse, so
+        # the first real request doesn't pay for engine initialization.
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        loop.run_until_complete(check_database())
+    return _handler
+
+
+def handler(event, context):
+    return _get_handler()(event, context)
@@ -6,7 +6,6 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite+aiosqlite:///./cricket_club.db"
     MANAGER_PIN_HASH: str = ""
     SCORER_PIN_HASH: str = ""
-    RATE_LIMIT: str = "30/minute"
     VAPID_PUBLIC_KEY: str = ""
     VAPID_PRIVATE_KEY: str = ""
     VAPID_EMAIL: str = "mailto:admin@aljinnahcc.com"
@@ -14,10 +13,13 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-change-in-production"  # Add for JWT/tokens if needed
     LOG_LEVEL: str = "INFO"
     MAX_REQUEST_SIZE: int = 10 * 1024 * 1024  # 10MB
+    RUN_MIGRATIONS: bool = True  # migrate the schema on startup; disable on serverless
 
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
+        # Tolerate retired keys (e.g. RATE_LIMIT) left in existing .env files
+        extra = "ignore"
 
 
 @lru_cache()
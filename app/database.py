@@ -1,5 +1,7 @@
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import get_settings
 
 settings = get_settings()
@@ -9,7 +11,14 @@ is_sqlite = settings.DATABASE_URL.startswith("sqlite")
 engine_kwargs = {
     "echo": False,
 }
-if not is_sqlite:
+if is_sqlite:
+    # aiosqlite may fall back to NullPool, which reopens the file and replays
+    # the PRAGMAs on every request. Liveness is checked on checkout below.
+    engine_kwargs["poolclass"] = AsyncAdaptedQueuePool
+    engine_kwargs["pool_size"] = 10
+    engine_kwargs["max_overflow"] = 20
+    engine_kwargs["pool_recycle"] = 1800
+else:
     engine_kwargs["pool_size"] = 20
     engine_kwargs["max_overflow"] = 10
     engine_kwargs["pool_pre_ping"] = True
@@ -17,19 +26,55 @@ if not is_sqlite:
 engine = create_async_engine(settings.DATABASE_URL, **engine_kwargs)
 
 if is_sqlite:
-    from sqlalchemy import event
+    from sqlalchemy import event, exc
 
     @event.listens_for(engine.sync_engine, "connect")
     def set_sqlite_pragma(dbapi_conn, connection_record):
         cursor = dbapi_conn.cursor()
+        # auto_vacuum only takes effect on a fresh database, so it must run
+        # before journal_mode writes the header.
+        cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
         cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64MB
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+        cursor.execute("PRAGMA busy_timeout=5000")
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
 
+    @event.listens_for(engine.sync_engine, "checkout")
+    def ping_sqlite_connection(dbapi_conn, connection_record, connection_proxy):
+        cursor = dbapi_conn.cursor()
+        try:
+            cursor.execute("PRAGMA foreign_keys")
+        except Exception as e:
+            raise exc.DisconnectionError() from e
+        finally:
+            cursor.close()
+
+# Dialect insert() so services can use ON CONFLICT clauses on either backend
+if is_sqlite:
+    from sqlalchemy.dialects.sqlite import insert as dialect_insert
+else:
+    from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+# Alembic migrations run on the sync drivers (see app/migrate.py)
+SYNC_DRIVERS = {"sqlite": "sqlite", "postgresql": "postgresql+psycopg2"}
+
+
+def sync_database_url() -> URL:
+    url = make_url(settings.DATABASE_URL)
+    return url.set(drivername=SYNC_DRIVERS.get(url.get_backend_name(), url.drivername))
+
+
+# autoflush is off: services must call `await session.flush()` themselves
+# when they need pending rows (e.g. generated ids) visible before commit.
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    autoflush=False,
 )
 
 
@@ -37,9 +82,8 @@ class Base(DeclarativeBase):
     pass
 
 
+# One session per request. Await its statements one at a time; SQLAlchemy
+# raises if a second coroutine uses the session while one is in flight.
 async def get_db():
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
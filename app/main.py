@@ -1,51 +1,123 @@
+import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
 import time
-import uuid
 from contextlib import asynccontextmanager
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
 
 from app.config import get_settings
-from app.database import engine, Base, AsyncSessionLocal
+from app.database import engine
+from app.migrate import upgrade_database
 from app.routers import match_router, upcoming_router, finance_router, notification_router
-from app.middleware import SecurityHeadersMiddleware, RateLimitMiddleware, InputValidationMiddleware
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log'),
-        logging.StreamHandler()
-    ]
+from app.middleware import UnifiedMiddleware
+from app.responses import ORJSONResponse
+
+# Use uvloop when available (uvicorn picks it via --loop; this covers Mangum)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Configure logging: records are queued on the event loop and written to
+# file/stream by a background listener thread
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+file_handler = logging.handlers.RotatingFileHandler('app.log', maxBytes=50_000_000, backupCount=5)
+file_handler.setFormatter(log_formatter)
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(log_formatter)
+
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue, file_handler, stream_handler, respect_handler_level=True
 )
+log_listener.start()
+atexit.register(log_listener.stop)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 start_time = time.time()
 
-limiter = Limiter(key_func=get_remote_address, default_limits=[settings.RATE_LIMIT])
+HEALTH_CACHE_TTL = 1.0  # seconds
+_HEALTH_STMT = text("SELECT 1")
+_db_health_cache = (0.0, "unknown")
+
+
+async def check_database() -> str:
+    """Ping the database, reusing the last result for HEALTH_CACHE_TTL seconds"""
+    global _db_health_cache
+    checked_at, db_status = _db_health_cache
+    now = time.monotonic()
+    if now - checked_at < HEALTH_CACHE_TTL:
+        return db_status
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(_HEALTH_STMT)
+        db_status = "healthy"
+    except Exception as e:
+        logger.error(f"Database health check failed: {e}")
+        db_status = "unhealthy"
+    _db_health_cache = (now, db_status)
+    return db_status
+
+
+async def health_payload(request_id: str) -> dict:
+    db_status = await check_database()
+    return {
+        "status": "ok" if db_status == "healthy" else "error",
+        "timestamp": time.time(),
+        "version": "1.0.0",
+        "environment": settings.ENVIRONMENT,
+        "database": db_status,
+        "request_id": request_id
+    }
+
+
+ROOT_PAYLOAD = {
+    "message": "Cricket Club Management API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/api/health"
+}
+
+
+async def root_payload(request_id: str) -> dict:
+    return ROOT_PAYLOAD
+
+
+async def metrics_payload(request_id: str) -> dict:
+    return {
+        "timestamp": time.time(),
+        "uptime": time.time() - start_time,
+        "environment": settings.ENVIRONMENT,
+        "database_url_type": "postgresql" if "postgresql" in settings.DATABASE_URL else "sqlite"
+    }
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up Cricket Club Management System")
-    try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all, checkfirst=True)
-        logger.info("Database tables checked/created successfully")
-    except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
-        # Don't crash the app, just log the error
-        pass
+    if settings.RUN_MIGRATIONS:
+        try:
+            await asyncio.to_thread(upgrade_database)
+            logger.info("Database schema checked/migrated successfully")
+        except Exception as e:
+            logger.error(f"Database initialization failed: {e}")
+            # Don't crash the app, just log the error
+            pass
     yield
     # Shutdown
+    await notification_router.close_push_client()
     logger.info("Shutting down Cricket Club Management System")
 
 app = FastAPI(
@@ -53,32 +125,22 @@ app = FastAPI(
     version="1.0.0",
     description="Production-grade cricket club management API with PIN-based role security.",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json"
 )
 
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
-# Add security middleware
-app.add_middleware(SecurityHeadersMiddleware)
-app.add_middleware(RateLimitMiddleware, limiter=limiter)
-app.add_middleware(InputValidationMiddleware)
-
-# Production CORS configuration
-allowed_origins = [
-    "http://localhost:3000",
-    "http://localhost:8080",
-    "https://yourdomain.com",  # Replace with your actual domain
-]
-
-# Always allow the deployed app URL
-if settings.ENVIRONMENT == "production":
-    allowed_origins.append("*")  # Allow all origins for Swagger docs
-
-if settings.ENVIRONMENT == "development":
-    allowed_origins.append("*")
+# Production CORS configuration; development and the deployed app (for
+# Swagger docs) allow all origins
+if settings.ENVIRONMENT in ("development", "production"):
+    allowed_origins = ["*"]
+else:
+    allowed_origins = [
+        "http://localhost:3000",
+        "http://localhost:8080",
+        "https://yourdomain.com",  # Replace with your actual domain
+    ]
 
 app.add_middleware(
     CORSMiddleware,
@@ -89,33 +151,17 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
-# Request ID middleware
-@app.middleware("http")
-async def add_request_id(request: Request, call_next):
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
-    start_time = time.time()
-    
-    response = await call_next(request)
-    
-    process_time = time.time() - start_time
-    response.headers["X-Request-ID"] = request_id
-    response.headers["X-Process-Time"] = str(process_time)
-    
-    logger.info(
-        f"Request: {request.method} {request.url.path} - "
-        f"Status: {response.status_code} - "
-        f"Time: {process_time:.4f}s - "
-        f"ID: {request_id}"
-    )
-    
-    return response
-
-
-@app.on_event("startup")
-async def startup():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+# Request ID, abuse tracking, input validation and security headers. Probe
+# endpoints are answered directly by this middleware; the route handlers
+# below only serve requests that carry an Origin header.
+app.add_middleware(
+    UnifiedMiddleware,
+    fast_paths={
+        "/api/health": health_payload,
+        "/": root_payload,
+        "/api/metrics": metrics_payload,
+    },
+)
 
 
 @app.exception_handler(Exception)
@@ -128,7 +174,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
     
     if settings.ENVIRONMENT == "development":
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "detail": "Internal server error.",
@@ -137,7 +183,7 @@ async def global_exception_handler(request: Request, exc: Exception):
             },
         )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error.",
@@ -156,47 +202,18 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
 @app.get("/api/health")
-@limiter.limit("60/minute")
 async def health_check(request: Request):
     """Health check endpoint with system status"""
-    try:
-        # Check database connection
-        async with AsyncSessionLocal() as session:
-            await session.execute("SELECT 1")
-            db_status = "healthy"
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        db_status = "unhealthy"
-    
-    return {
-        "status": "ok" if db_status == "healthy" else "error",
-        "timestamp": time.time(),
-        "version": "1.0.0",
-        "environment": settings.ENVIRONMENT,
-        "database": db_status,
-        "request_id": getattr(request.state, 'request_id', 'unknown')
-    }
+    return await health_payload(request.state.request_id)
 
 
 @app.get("/")
-@limiter.limit("30/minute")
 async def root(request: Request):
     """Root endpoint"""
-    return {
-        "message": "Cricket Club Management API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/api/health"
-    }
+    return await root_payload(request.state.request_id)
 
 
 @app.get("/api/metrics")
-@limiter.limit("30/minute")
 async def metrics(request: Request):
     """Basic metrics endpoint"""
-    return {
-        "timestamp": time.time(),
-        "uptime": time.time() - start_time,
-        "environment": settings.ENVIRONMENT,
-        "database_url_type": "postgresql" if "postgresql" in settings.DATABASE_URL else "sqlite"
-    }
+    return await metrics_payload(request.state.request_id)
@@ -0,0 +1,78 @@
+"""
+Create or upgrade the database schema.
+Run: python -m app.migrate
+
+Deploys run this once before the new code serves traffic (see Procfile);
+with RUN_MIGRATIONS enabled the app also runs it on startup. An empty
+database is created from the models and stamped at the latest revision. A
+database without an alembic_version table was created by create_all before
+migrations existed, so it is stamped at the baseline revision and upgraded.
+"""
+import logging
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import BINARY, create_engine, event, inspect, pool
+
+from app.database import Base, sync_database_url
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_REVISION = "0001"
+
+
+def migration_engine():
+    engine = create_engine(sync_database_url(), poolclass=pool.NullPool)
+    if engine.dialect.name == "sqlite":
+        # SQLite reflects type names it doesn't know by affinity, which would
+        # turn the BINARY(16) GUID columns into NUMERIC(16) whenever batch
+        # mode rebuilds a table
+        engine.dialect.ischema_names = {**engine.dialect.ischema_names, "BINARY": BINARY}
+
+        # pysqlite manages transactions around DDL itself; hand control to
+        # SQLAlchemy so a failed migration (including batch table rebuilds)
+        # rolls back as a whole. foreign_keys stays off on these connections,
+        # so rebuilding a parent table doesn't cascade into its children.
+        @event.listens_for(engine, "connect")
+        def disable_pysqlite_transactions(dbapi_conn, connection_record):
+            dbapi_conn.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def begin_sqlite_transaction(conn):
+            conn.exec_driver_sql("BEGIN")
+    return engine
+
+
+def alembic_config(connection=None) -> Config:
+    config = Config(os.path.join(ROOT_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(ROOT_DIR, "alembic"))
+    # Keep the app's logging setup when run in-process
+    config.attributes["configure_logger"] = False
+    config.attributes["connection"] = connection
+    return config
+
+
+def upgrade_database() -> None:
+    engine = migration_engine()
+    try:
+        with engine.begin() as conn:
+            config = alembic_config(conn)
+            tables = set(inspect(conn).get_table_names())
+            if not tables - {"alembic_version"}:
+                Base.metadata.create_all(conn)
+                command.stamp(config, "head")
+                logger.info("Created database schema")
+                return
+            if "alembic_version" not in tables:
+                command.stamp(config, BASELINE_REVISION)
+            command.upgrade(config, "head")
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s [%(name)s] %(message)s")
+    upgrade_database()
@@ -1,6 +1,7 @@
 from app.models.match import Match, Innings, BallEvent
 from app.models.upcoming import UpcomingMatch, PlayerAvailability
 from app.models.finance import FinancePeriod, FinanceEntry
+from app.models.notification import PushSubscription
 
 __all__ = [
     "Match",
@@ -10,4 +11,5 @@ __all__ = [
     "PlayerAvailability",
     "FinancePeriod",
     "FinanceEntry",
+    "PushSubscription",
 ]
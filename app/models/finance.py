@@ -1,11 +1,14 @@
 import uuid
-from datetime import datetime
+from decimal import Decimal
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum, Text, Numeric
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, ForeignKey, Text, Index, UniqueConstraint
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.database import Base
+from app.models.types import GUID, CodedEnum
 
 
 class EntryType(str, PyEnum):
@@ -13,39 +16,69 @@ class EntryType(str, PyEnum):
     EXPENSE = "expense"
 
 
+ENTRY_TYPE_CODES = {
+    EntryType.INCOME: "in",
+    EntryType.EXPENSE: "ex",
+}
+
+
 class FinancePeriod(Base):
     __tablename__ = "finance_periods"
+    __table_args__ = (
+        UniqueConstraint("year", "month", name="uq_period_year_month"),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
     label = Column(String(100), nullable=False)  # e.g. "January 2026"
     year = Column(Integer, nullable=False)
     month = Column(Integer, nullable=False)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    __mapper_args__ = {"eager_defaults": True}
+
+    # ON DELETE CASCADE removes entries, so deleting a period doesn't load them
     entries = relationship(
         "FinanceEntry",
         back_populates="period",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
 class FinanceEntry(Base):
     __tablename__ = "finance_entries"
+    __table_args__ = (
+        Index("ix_finance_entries_period_date", "period_id", "date"),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
     period_id = Column(
-        String(36),
+        GUID,
         ForeignKey("finance_periods.id", ondelete="CASCADE"),
         nullable=False,
     )
-    entry_type = Column(Enum(EntryType), nullable=False)
+    entry_type = Column(CodedEnum(EntryType, ENTRY_TYPE_CODES), nullable=False)
     category = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
-    amount = Column(Numeric(12, 2), nullable=False)
+    amount_cents = Column(BigInteger, nullable=False)
     date = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __mapper_args__ = {"eager_defaults": True}
 
     period = relationship("FinancePeriod", back_populates="entries")
+
+    @hybrid_property
+    def amount(self) -> Decimal:
+        return Decimal(self.amount_cents).scaleb(-2)
+
+    @amount.setter
+    def amount(self, value) -> None:
+        self.amount_cents = int(Decimal(value).scaleb(2))
+
+    @amount.expression
+    def amount(cls):
+        return cls.amount_cents / 100
@@ -1,13 +1,14 @@
 import uuid
-from datetime import datetime
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
-    Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Enum, Float
+    Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Float, Index, Computed
 )
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.database import Base
+from app.models.types import GUID, CodedEnum
 
 
 class MatchStatus(str, PyEnum):
@@ -46,29 +47,75 @@ class ExtraType(str, PyEnum):
     PENALTY = "penalty"
 
 
+MATCH_STATUS_CODES = {
+    MatchStatus.TOSS: "ts",
+    MatchStatus.IN_PROGRESS: "ip",
+    MatchStatus.INNINGS_BREAK: "ib",
+    MatchStatus.COMPLETED: "co",
+    MatchStatus.ABANDONED: "ab",
+}
+
+INNINGS_STATUS_CODES = {
+    InningsStatus.NOT_STARTED: "ns",
+    InningsStatus.IN_PROGRESS: "ip",
+    InningsStatus.COMPLETED: "co",
+}
+
+DISMISSAL_TYPE_CODES = {
+    DismissalType.BOWLED: "b",
+    DismissalType.CAUGHT: "c",
+    DismissalType.LBW: "lb",
+    DismissalType.RUN_OUT: "ro",
+    DismissalType.STUMPED: "st",
+    DismissalType.HIT_WICKET: "hw",
+    DismissalType.RETIRED_HURT: "rh",
+    DismissalType.OBSTRUCTING: "of",
+    DismissalType.TIMED_OUT: "to",
+    DismissalType.HANDLED_BALL: "hb",
+}
+
+EXTRA_TYPE_CODES = {
+    ExtraType.NONE: "-",
+    ExtraType.WIDE: "w",
+    ExtraType.NO_BALL: "nb",
+    ExtraType.BYE: "b",
+    ExtraType.LEG_BYE: "lb",
+    ExtraType.PENALTY: "p",
+}
+
+
 class Match(Base):
     __tablename__ = "matches"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
     team_a_name = Column(String(100), nullable=False)
     team_b_name = Column(String(100), nullable=False)
     total_overs = Column(Integer, nullable=False)
     venue = Column(String(200), nullable=True)
     toss_winner = Column(String(100), nullable=True)
     toss_decision = Column(String(10), nullable=True)  # bat / bowl
-    status = Column(Enum(MatchStatus), default=MatchStatus.TOSS, nullable=False)
+    status = Column(CodedEnum(MatchStatus, MATCH_STATUS_CODES), default=MatchStatus.TOSS, nullable=False)
     result_summary = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Fetch server-generated timestamps via RETURNING on INSERT/UPDATE, so
+    # writes don't need a refresh() round-trip
+    __mapper_args__ = {"eager_defaults": True}
 
-    innings = relationship("Innings", back_populates="match", cascade="all, delete-orphan", order_by="Innings.innings_number")
+    # passive_deletes: the ON DELETE CASCADE foreign keys remove innings and
+    # balls, so deleting a match doesn't load them first
+    innings = relationship("Innings", back_populates="match", cascade="all, delete-orphan", passive_deletes=True, order_by="Innings.innings_number")
 
 
 class Innings(Base):
     __tablename__ = "innings"
+    __table_args__ = (
+        Index("ix_innings_match_num", "match_id", "innings_number"),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    match_id = Column(String(36), ForeignKey("matches.id", ondelete="CASCADE"), nullable=False)
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    match_id = Column(GUID, ForeignKey("matches.id", ondelete="CASCADE"), nullable=False)
     innings_number = Column(Integer, nullable=False)  # 1 or 2
     batting_team = Column(String(100), nullable=False)
     bowling_team = Column(String(100), nullable=False)
@@ -80,24 +127,39 @@ class Innings(Base):
     extras_byes = Column(Integer, default=0, nullable=False)
     extras_leg_byes = Column(Integer, default=0, nullable=False)
     extras_penalties = Column(Integer, default=0, nullable=False)
+    # Stored generated column, maintained by the database on every write
+    extras_total = Column(
+        Integer,
+        Computed("extras_wides + extras_no_balls + extras_byes + extras_leg_byes + extras_penalties", persisted=True),
+    )
     target = Column(Integer, nullable=True)
-    status = Column(Enum(InningsStatus), default=InningsStatus.NOT_STARTED, nullable=False)
+    status = Column(CodedEnum(InningsStatus, INNINGS_STATUS_CODES), default=InningsStatus.NOT_STARTED, nullable=False)
     current_over = Column(Integer, default=0, nullable=False)
     current_ball = Column(Integer, default=0, nullable=False)
     striker_name = Column(String(100), nullable=True)
     non_striker_name = Column(String(100), nullable=True)
     current_bowler_name = Column(String(100), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Balls not undone; kept in step by record_ball/undo_last_ball so neither
+    # has to load the innings' balls
+    active_ball_count = Column(Integer, default=0, server_default="0", nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    __mapper_args__ = {"eager_defaults": True}
 
     match = relationship("Match", back_populates="innings")
-    balls = relationship("BallEvent", back_populates="innings", cascade="all, delete-orphan", order_by="BallEvent.sequence_number")
+    balls = relationship("BallEvent", back_populates="innings", cascade="all, delete-orphan", passive_deletes=True, order_by="BallEvent.sequence_number")
 
 
 class BallEvent(Base):
     __tablename__ = "ball_events"
-
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    innings_id = Column(String(36), ForeignKey("innings.id", ondelete="CASCADE"), nullable=False)
+    __table_args__ = (
+        Index("ix_ball_events_innings_seq", "innings_id", "sequence_number"),
+        Index("ix_ball_events_innings_active_seq", "innings_id", "is_undone", "sequence_number"),
+        Index("ix_ball_events_innings_over_ball", "innings_id", "over_number", "ball_number"),
+    )
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    innings_id = Column(GUID, ForeignKey("innings.id", ondelete="CASCADE"), nullable=False)
     sequence_number = Column(Integer, nullable=False)
     over_number = Column(Integer, nullable=False)
     ball_number = Column(Integer, nullable=False)
@@ -107,14 +169,14 @@ class BallEvent(Base):
     runs_scored = Column(Integer, default=0, nullable=False)
     is_boundary_four = Column(Boolean, default=False, nullable=False)
     is_boundary_six = Column(Boolean, default=False, nullable=False)
-    extra_type = Column(Enum(ExtraType), default=ExtraType.NONE, nullable=False)
+    extra_type = Column(CodedEnum(ExtraType, EXTRA_TYPE_CODES), default=ExtraType.NONE, nullable=False)
     extra_runs = Column(Integer, default=0, nullable=False)
     is_wicket = Column(Boolean, default=False, nullable=False)
-    dismissal_type = Column(Enum(DismissalType), nullable=True)
+    dismissal_type = Column(CodedEnum(DismissalType, DISMISSAL_TYPE_CODES), nullable=True)
     dismissed_batsman = Column(String(100), nullable=True)
     fielder_name = Column(String(100), nullable=True)
     is_legal_delivery = Column(Boolean, default=True, nullable=False)
     is_undone = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     innings = relationship("Innings", back_populates="balls")
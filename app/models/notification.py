@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class PushSubscription(Base):
+    __tablename__ = "push_subscriptions"
+
+    # Endpoints share their push service origin as a prefix, so primary key
+    # order already groups a fan-out by origin
+    endpoint = Column(String(1024), primary_key=True)
+    p256dh = Column(String(255), nullable=False)
+    auth = Column(String(255), nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
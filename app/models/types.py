@@ -0,0 +1,54 @@
+import uuid
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import BINARY, String, TypeDecorator
+
+
+class GUID(TypeDecorator):
+    """UUID stored as native UUID on PostgreSQL and BINARY(16) elsewhere"""
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(BINARY(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        if dialect.name == "postgresql":
+            return value
+        return value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(bytes=value)
+
+
+class CodedEnum(TypeDecorator):
+    """Python enum stored as a short string code, e.g. CodedEnum(MatchStatus, {MatchStatus.TOSS: "ts", ...})"""
+
+    impl = String(2)
+    cache_ok = True
+
+    def __init__(self, enum_class, codes):
+        super().__init__()
+        self.enum_class = enum_class
+        self.codes = tuple(codes.items())
+        self._to_code = dict(self.codes)
+        self._from_code = {code: member for member, code in self.codes}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._to_code[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._from_code[value]
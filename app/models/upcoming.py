@@ -1,11 +1,12 @@
 import uuid
-from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum, Text
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.database import Base
+from app.models.types import GUID, CodedEnum
 
 
 class AvailabilityStatus(str, PyEnum):
@@ -14,17 +15,29 @@ class AvailabilityStatus(str, PyEnum):
     MAYBE = "maybe"
 
 
+AVAILABILITY_STATUS_CODES = {
+    AvailabilityStatus.AVAILABLE: "y",
+    AvailabilityStatus.NOT_AVAILABLE: "n",
+    AvailabilityStatus.MAYBE: "m",
+}
+
+
 class UpcomingMatch(Base):
     __tablename__ = "upcoming_matches"
+    __table_args__ = (
+        Index("ix_upcoming_matches_match_date", "match_date"),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
     opponent_name = Column(String(100), nullable=False)
     match_date = Column(DateTime, nullable=False)
     venue = Column(String(200), nullable=True)
     overs = Column(Integer, nullable=True)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __mapper_args__ = {"eager_defaults": True}
 
     availabilities = relationship(
         "PlayerAvailability",
@@ -35,17 +48,24 @@ class UpcomingMatch(Base):
 
 class PlayerAvailability(Base):
     __tablename__ = "player_availabilities"
+    __table_args__ = (
+        # One availability per device per match; the upsert in submit_availability
+        # targets this index
+        Index("ix_player_availabilities_match_device", "upcoming_match_id", "device_fingerprint", unique=True),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
     upcoming_match_id = Column(
-        String(36),
+        GUID,
         ForeignKey("upcoming_matches.id", ondelete="CASCADE"),
         nullable=False,
     )
     player_name = Column(String(100), nullable=False)
-    status = Column(Enum(AvailabilityStatus), nullable=False)
+    status = Column(CodedEnum(AvailabilityStatus, AVAILABILITY_STATUS_CODES), nullable=False)
     device_fingerprint = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __mapper_args__ = {"eager_defaults": True}
 
     upcoming_match = relationship("UpcomingMatch", back_populates="availabilities")
@@ -0,0 +1,9 @@
+import orjson
+from starlette.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
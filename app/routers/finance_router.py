@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+from uuid import UUID
 
 from app.database import get_db
 from app.security import require_manager_pin
@@ -28,7 +29,7 @@ async def list_periods(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/periods/{period_id}", response_model=FinancePeriodResponse)
-async def get_period(period_id: str, db: AsyncSession = Depends(get_db)):
+async def get_period(period_id: UUID, db: AsyncSession = Depends(get_db)):
     return await FinanceService.get_period_with_summary(db, period_id)
 
 
@@ -46,7 +47,7 @@ async def create_period(
 
 @router.put("/periods/{period_id}", response_model=FinancePeriodResponse)
 async def update_period(
-    period_id: str,
+    period_id: UUID,
     req: UpdateFinancePeriodRequest,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_manager_pin),
@@ -57,7 +58,7 @@ async def update_period(
 
 @router.delete("/periods/{period_id}", status_code=204)
 async def delete_period(
-    period_id: str,
+    period_id: UUID,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_manager_pin),
 ):
@@ -66,7 +67,7 @@ async def delete_period(
 
 @router.post("/periods/{period_id}/entries", response_model=FinanceEntryResponse, status_code=201)
 async def add_entry(
-    period_id: str,
+    period_id: UUID,
     req: CreateFinanceEntryRequest,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_manager_pin),
@@ -76,7 +77,7 @@ async def add_entry(
 
 @router.put("/entries/{entry_id}", response_model=FinanceEntryResponse)
 async def update_entry(
-    entry_id: str,
+    entry_id: UUID,
     req: UpdateFinanceEntryRequest,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_manager_pin),
@@ -86,7 +87,7 @@ async def update_entry(
 
 @router.delete("/entries/{entry_id}", status_code=204)
 async def delete_entry(
-    entry_id: str,
+    entry_id: UUID,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_manager_pin),
 ):
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -6,10 +6,11 @@ from app.security import require_scorer_pin
 from app.services.match_service import MatchService
 from app.schemas.match import (
     CreateMatchRequest, SetTossRequest, StartInningsRequest,
-    RecordBallRequest, ChangeBowlerRequest,
+    RecordBallRequest, RecordBallsRequest, ChangeBowlerRequest,
     MatchResponse, MatchListItem, FullScorecard, InningsResponse,
 )
 from typing import List
+from uuid import UUID
 
 router = APIRouter(prefix="/api/matches", tags=["Matches"])
 
@@ -17,17 +18,21 @@ router = APIRouter(prefix="/api/matches", tags=["Matches"])
 # ── PUBLIC ENDPOINTS ──────────────────────────────────────────
 
 @router.get("", response_model=List[MatchListItem])
-async def list_matches(db: AsyncSession = Depends(get_db)):
-    return await MatchService.list_matches(db)
+async def list_matches(
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    return await MatchService.list_matches(db, limit, offset)
 
 
 @router.get("/{match_id}", response_model=MatchResponse)
-async def get_match(match_id: str, db: AsyncSession = Depends(get_db)):
+async def get_match(match_id: UUID, db: AsyncSession = Depends(get_db)):
     return await MatchService.get_match(db, match_id)
 
 
 @router.get("/{match_id}/scorecard", response_model=FullScorecard)
-async def get_scorecard(match_id: str, db: AsyncSession = Depends(get_db)):
+async def get_scorecard(match_id: UUID, db: AsyncSession = Depends(get_db)):
     return await MatchService.get_scorecard(db, match_id)
 
 
@@ -45,7 +50,7 @@ async def create_match(
 
 @router.post("/{match_id}/toss", response_model=MatchResponse)
 async def set_toss(
-    match_id: str,
+    match_id: UUID,
     req: SetTossRequest,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_scorer_pin),
@@ -56,7 +61,7 @@ async def set_toss(
 
 @router.post("/{match_id}/innings", response_model=InningsResponse, status_code=201)
 async def start_innings(
-    match_id: str,
+    match_id: UUID,
     req: StartInningsRequest,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_scorer_pin),
@@ -66,7 +71,7 @@ async def start_innings(
 
 @router.post("/{match_id}/ball")
 async def record_ball(
-    match_id: str,
+    match_id: UUID,
     req: RecordBallRequest,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_scorer_pin),
@@ -81,9 +86,27 @@ async def record_ball(
     }
 
 
+@router.post("/{match_id}/balls")
+async def record_balls(
+    match_id: UUID,
+    req: RecordBallsRequest,
+    db: AsyncSession = Depends(get_db),
+    _pin=Depends(require_scorer_pin),
+):
+    result = await MatchService.record_balls_bulk(db, match_id, req.balls)
+    match = await MatchService.get_match(db, match_id)
+    return {
+        "balls_recorded": result["balls_recorded"],
+        "over_complete": result["over_complete"],
+        "innings_ended": result["innings_ended"],
+        "result_summary": result["result_summary"],
+        "match": MatchResponse.model_validate(match),
+    }
+
+
 @router.post("/{match_id}/undo")
 async def undo_last_ball(
-    match_id: str,
+    match_id: UUID,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_scorer_pin),
 ):
@@ -97,7 +120,7 @@ async def undo_last_ball(
 
 @router.post("/{match_id}/change-bowler", response_model=InningsResponse)
 async def change_bowler(
-    match_id: str,
+    match_id: UUID,
     req: ChangeBowlerRequest,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_scorer_pin),
@@ -107,7 +130,7 @@ async def change_bowler(
 
 @router.post("/{match_id}/swap-strike", response_model=InningsResponse)
 async def swap_strike(
-    match_id: str,
+    match_id: UUID,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_scorer_pin),
 ):
@@ -116,7 +139,7 @@ async def swap_strike(
 
 @router.post("/{match_id}/end-innings", response_model=MatchResponse)
 async def end_innings(
-    match_id: str,
+    match_id: UUID,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_scorer_pin),
 ):
@@ -125,7 +148,7 @@ async def end_innings(
 
 @router.post("/{match_id}/abandon", response_model=MatchResponse)
 async def abandon_match(
-    match_id: str,
+    match_id: UUID,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_scorer_pin),
 ):
@@ -134,7 +157,7 @@ async def abandon_match(
 
 @router.delete("/{match_id}", status_code=204)
 async def delete_match(
-    match_id: str,
+    match_id: UUID,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_scorer_pin),
 ):
@@ -1,67 +1,232 @@
-from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import base64
 import json
 import logging
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
 
-from pywebpush import webpush, WebPushException
+import http_ece
+import httpx
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal, dialect_insert, get_db
+from app.models.notification import PushSubscription
+from app.schemas.notification import PushSubscriptionRequest
 
 router = APIRouter(prefix="/api/notifications", tags=["Notifications"])
 
 logger = logging.getLogger(__name__)
 
-subscriptions: list = []
+settings = get_settings()
+
+PUSH_TTL = 86400  # seconds the push service may hold an undelivered message
+PUSH_CONCURRENCY = 64
+PUSH_BATCH_SIZE = 1000  # subscription rows held in memory per fan-out step
+VAPID_EXPIRY = 12 * 60 * 60
+VAPID_REFRESH_MARGIN = 5 * 60  # re-sign before the push service sees an expired token
+
+# Shared across fan-outs so each push service origin keeps one multiplexed
+# HTTP/2 connection alive instead of a TLS handshake per subscriber
+_push_client: Optional[httpx.AsyncClient] = None
+
+# Signed VAPID Authorization header per push service origin -> expiry (epoch)
+_jwt_cache: Dict[str, Tuple[str, float]] = {}
 
+# The public key is fixed for the process lifetime, so its response body is
+# serialized once. A fresh Response is still built per request because
+# middleware (e.g. CORS) appends to the response's header list in place.
+VAPID_KEY_BODY = json.dumps({"publicKey": settings.VAPID_PUBLIC_KEY}).encode()
+VAPID_KEY_HEADERS = {"Cache-Control": "public, max-age=86400, immutable"}
 
-class PushSubscription(BaseModel):
-    endpoint: str
-    keys: dict
+# VAPID signing key and its base64url public point, loaded on first use
+_vapid_key: Optional[Tuple[ec.EllipticCurvePrivateKey, str]] = None
 
 
 @router.post("/subscribe", status_code=201)
-async def subscribe(sub: PushSubscription):
-    sub_dict = sub.model_dump()
-    for existing in subscriptions:
-        if existing["endpoint"] == sub_dict["endpoint"]:
-            return {"status": "already_subscribed"}
-    subscriptions.append(sub_dict)
+async def subscribe(sub: PushSubscriptionRequest, db: AsyncSession = Depends(get_db)):
+    p256dh = sub.keys.get("p256dh")
+    auth = sub.keys.get("auth")
+    if not p256dh or not auth:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Subscription keys must include p256dh and auth.",
+        )
+    stmt = (
+        dialect_insert(PushSubscription)
+        .values(endpoint=sub.endpoint, p256dh=p256dh, auth=auth)
+        .on_conflict_do_nothing(index_elements=["endpoint"])
+    )
+    result = await db.execute(stmt)
+    await db.commit()
+    if result.rowcount == 0:
+        return {"status": "already_subscribed"}
     return {"status": "subscribed"}
 
 
 @router.post("/unsubscribe", status_code=200)
-async def unsubscribe(sub: PushSubscription):
-    global subscriptions
-    subscriptions = [s for s in subscriptions if s["endpoint"] != sub.endpoint]
+async def unsubscribe(sub: PushSubscriptionRequest, db: AsyncSession = Depends(get_db)):
+    await db.execute(delete(PushSubscription).where(PushSubscription.endpoint == sub.endpoint))
+    await db.commit()
     return {"status": "unsubscribed"}
 
 
 @router.get("/vapid-public-key")
 async def get_vapid_key():
-    from app.config import get_settings
-    settings = get_settings()
-    return {"publicKey": settings.VAPID_PUBLIC_KEY}
+    return Response(content=VAPID_KEY_BODY, media_type="application/json", headers=VAPID_KEY_HEADERS)
+
+
+def get_push_client() -> httpx.AsyncClient:
+    global _push_client
+    if _push_client is None:
+        _push_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=10.0,
+        )
+    return _push_client
+
+
+async def close_push_client():
+    global _push_client
+    if _push_client is not None:
+        await _push_client.aclose()
+        _push_client = None
+
+
+def _b64url_decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _b64url_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+JWT_HEADER = _b64url_encode(b'{"typ":"JWT","alg":"ES256"}')
 
 
-def send_push_to_all(title: str, body: str, url: str = "/"):
-    global subscriptions
-    from app.config import get_settings
-    settings = get_settings()
+def _origin(endpoint: str) -> str:
+    parsed = urlparse(endpoint)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _get_vapid_key() -> Tuple[ec.EllipticCurvePrivateKey, str]:
+    """Load VAPID_PRIVATE_KEY, given either as a raw 32-byte scalar or DER, both base64url"""
+    global _vapid_key
+    if _vapid_key is None:
+        raw = _b64url_decode(settings.VAPID_PRIVATE_KEY.replace("\n", ""))
+        if len(raw) == 32:
+            key = ec.derive_private_key(int.from_bytes(raw, "big"), ec.SECP256R1())
+        else:
+            key = serialization.load_der_private_key(raw, password=None)
+        public_point = key.public_key().public_bytes(
+            serialization.Encoding.X962,
+            serialization.PublicFormat.UncompressedPoint,
+        )
+        _vapid_key = (key, _b64url_encode(public_point))
+    return _vapid_key
+
+
+def _vapid_auth_header(origin: str) -> str:
+    """Return a VAPID Authorization header for origin, signing only when the cached one is near expiry"""
+    now = time.time()
+    cached = _jwt_cache.get(origin)
+    if cached is not None and cached[1] - VAPID_REFRESH_MARGIN > now:
+        return cached[0]
+    exp = int(now) + VAPID_EXPIRY
+    key, public_key = _get_vapid_key()
+    claims = json.dumps(
+        {"aud": origin, "exp": exp, "sub": settings.VAPID_EMAIL},
+        separators=(",", ":"),
+    ).encode()
+    signing_input = f"{JWT_HEADER}.{_b64url_encode(claims)}"
+    # ES256 signatures are the raw r || s pair, not the DER cryptography returns
+    r, s = decode_dss_signature(key.sign(signing_input.encode(), ec.ECDSA(hashes.SHA256())))
+    signature = _b64url_encode(r.to_bytes(32, "big") + s.to_bytes(32, "big"))
+    header = f"vapid t={signing_input}.{signature},k={public_key}"
+    _jwt_cache[origin] = (header, exp)
+    return header
+
+
+async def _send_one(client, semaphore, sub, payload: bytes, auth_header: str, server_key) -> Optional[int]:
+    """Encrypt and POST a single push, returning the status code"""
+    # http_ece randomizes the salt per call, so the content key stays unique
+    # even though the ECDH key is shared across the batch
+    body = http_ece.encrypt(
+        payload,
+        private_key=server_key,
+        dh=_b64url_decode(sub.p256dh),
+        auth_secret=_b64url_decode(sub.auth),
+        version="aes128gcm",
+    )
+    headers = {
+        "Authorization": auth_header,
+        "Content-Encoding": "aes128gcm",
+        "Content-Type": "application/octet-stream",
+        "TTL": str(PUSH_TTL),
+    }
+    async with semaphore:
+        response = await client.post(sub.endpoint, content=body, headers=headers)
+    if response.status_code > 202:
+        logger.warning(f"Push failed for {sub.endpoint}: {response.status_code}")
+    return response.status_code
+
+
+async def _send_batch(client, semaphore, batch, payload: bytes, auth_headers: dict, server_key) -> list:
+    """Send one batch of subscriptions, returning endpoints that have expired"""
+    for sub in batch:
+        origin = _origin(sub.endpoint)
+        if origin not in auth_headers:
+            auth_headers[origin] = _vapid_auth_header(origin)
+    # Only HTTP sends run concurrently; the DB session is not touched here
+    results = await asyncio.gather(
+        *(
+            _send_one(
+                client, semaphore, sub, payload,
+                auth_headers[_origin(sub.endpoint)], server_key,
+            )
+            for sub in batch
+        ),
+        return_exceptions=True,
+    )
+    expired = []
+    for sub, result in zip(batch, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Push error for {sub.endpoint}: {result}")
+        elif result in (404, 410):
+            expired.append(sub.endpoint)
+    return expired
+
+
+async def send_push_to_all(title: str, body: str, url: str = "/"):
     if not settings.VAPID_PRIVATE_KEY or not settings.VAPID_PUBLIC_KEY:
         return
-    payload = json.dumps({"title": title, "body": body, "url": url})
-    failed = []
-    for sub in subscriptions:
-        try:
-            webpush(
-                subscription_info=sub,
-                data=payload,
-                vapid_private_key=settings.VAPID_PRIVATE_KEY,
-                vapid_claims={"sub": settings.VAPID_EMAIL},
+    payload = json.dumps({"title": title, "body": body, "url": url}).encode()
+    server_key = ec.generate_private_key(ec.SECP256R1())
+    client = get_push_client()
+    semaphore = asyncio.Semaphore(PUSH_CONCURRENCY)
+    auth_headers = {}
+    expired = []
+
+    # Runs as a background task, so it opens its own session
+    async with AsyncSessionLocal() as db:
+        stmt = (
+            select(PushSubscription.endpoint, PushSubscription.p256dh, PushSubscription.auth)
+            .order_by(PushSubscription.endpoint)
+        )
+        result = await db.stream(stmt)
+        async for batch in result.partitions(PUSH_BATCH_SIZE):
+            expired.extend(
+                await _send_batch(client, semaphore, batch, payload, auth_headers, server_key)
             )
-        except WebPushException as e:
-            logger.warning(f"Push failed for {sub['endpoint']}: {e}")
-            if "410" in str(e) or "404" in str(e):
-                failed.append(sub["endpoint"])
-        except Exception as e:
-            logger.warning(f"Push error: {e}")
-    if failed:
-        subscriptions = [s for s in subscriptions if s["endpoint"] not in failed]
+        await result.close()
+
+        if expired:
+            await db.execute(delete(PushSubscription).where(PushSubscription.endpoint.in_(expired)))
+            await db.commit()
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+from uuid import UUID
 
 from app.database import get_db
 from app.security import require_manager_pin
@@ -23,13 +24,13 @@ async def list_upcoming_matches(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{match_id}", response_model=UpcomingMatchResponse)
-async def get_upcoming_match(match_id: str, db: AsyncSession = Depends(get_db)):
+async def get_upcoming_match(match_id: UUID, db: AsyncSession = Depends(get_db)):
     return await UpcomingMatchService.get_match_with_availability(db, match_id)
 
 
 @router.post("/{match_id}/availability", response_model=PlayerAvailabilityResponse)
 async def submit_availability(
-    match_id: str,
+    match_id: UUID,
     req: SubmitAvailabilityRequest,
     db: AsyncSession = Depends(get_db),
 ):
@@ -41,24 +42,24 @@ async def submit_availability(
 @router.post("", response_model=UpcomingMatchResponse, status_code=201)
 async def create_upcoming_match(
     req: CreateUpcomingMatchRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_manager_pin),
 ):
     match = await UpcomingMatchService.create_match(db, req)
-    try:
-        send_push_to_all(
-            title="New Match Scheduled!",
-            body=f"vs {req.opponent_name} — Check availability now",
-            url=f"/upcoming/{match.id}",
-        )
-    except Exception:
-        pass
+    # Fan-out runs after the response is sent
+    background_tasks.add_task(
+        send_push_to_all,
+        title="New Match Scheduled!",
+        body=f"vs {req.opponent_name} — Check availability now",
+        url=f"/upcoming/{match.id}",
+    )
     return await UpcomingMatchService.get_match_with_availability(db, match.id)
 
 
 @router.put("/{match_id}", response_model=UpcomingMatchResponse)
 async def update_upcoming_match(
-    match_id: str,
+    match_id: UUID,
     req: UpdateUpcomingMatchRequest,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_manager_pin),
@@ -69,7 +70,7 @@ async def update_upcoming_match(
 
 @router.delete("/{match_id}", status_code=204)
 async def delete_upcoming_match(
-    match_id: str,
+    match_id: UUID,
     db: AsyncSession = Depends(get_db),
     _pin=Depends(require_manager_pin),
 ):
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
+from uuid import UUID
 from decimal import Decimal
 from app.models.finance import EntryType
 
@@ -34,8 +35,8 @@ class UpdateFinanceEntryRequest(BaseModel):
 
 
 class FinanceEntryResponse(BaseModel):
-    id: str
-    period_id: str
+    id: UUID
+    period_id: UUID
     entry_type: EntryType
     category: str
     description: Optional[str]
@@ -44,8 +45,7 @@ class FinanceEntryResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PeriodSummary(BaseModel):
@@ -55,7 +55,7 @@ class PeriodSummary(BaseModel):
 
 
 class FinancePeriodResponse(BaseModel):
-    id: str
+    id: UUID
     label: str
     year: int
     month: int
@@ -65,20 +65,18 @@ class FinancePeriodResponse(BaseModel):
     entries: List[FinanceEntryResponse] = []
     summary: Optional[PeriodSummary] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FinancePeriodListItem(BaseModel):
-    id: str
+    id: UUID
     label: str
     year: int
     month: int
     created_at: datetime
     summary: Optional[PeriodSummary] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OverallFinanceSummary(BaseModel):
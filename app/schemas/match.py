@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
+from uuid import UUID
 from app.models.match import MatchStatus, InningsStatus, DismissalType, ExtraType
 
 
@@ -37,6 +38,10 @@ class RecordBallRequest(BaseModel):
     new_batsman_name: Optional[str] = Field(None, max_length=100)
 
 
+class RecordBallsRequest(BaseModel):
+    balls: List[RecordBallRequest] = Field(..., min_length=1, max_length=300)
+
+
 class ChangeBowlerRequest(BaseModel):
     bowler_name: str = Field(..., min_length=1, max_length=100)
 
@@ -46,7 +51,7 @@ class ChangeStrikeRequest(BaseModel):
 
 
 class BallEventResponse(BaseModel):
-    id: str
+    id: UUID
     sequence_number: int
     over_number: int
     ball_number: int
@@ -65,12 +70,11 @@ class BallEventResponse(BaseModel):
     is_legal_delivery: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InningsResponse(BaseModel):
-    id: str
+    id: UUID
     innings_number: int
     batting_team: str
     bowling_team: str
@@ -91,12 +95,11 @@ class InningsResponse(BaseModel):
     current_bowler_name: Optional[str]
     balls: List[BallEventResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MatchResponse(BaseModel):
-    id: str
+    id: UUID
     team_a_name: str
     team_b_name: str
     total_overs: int
@@ -109,12 +112,11 @@ class MatchResponse(BaseModel):
     updated_at: datetime
     innings: List[InningsResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MatchListItem(BaseModel):
-    id: str
+    id: UUID
     team_a_name: str
     team_b_name: str
     total_overs: int
@@ -123,8 +125,7 @@ class MatchListItem(BaseModel):
     result_summary: Optional[str]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BatsmanStats(BaseModel):
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class PushSubscriptionRequest(BaseModel):
+    endpoint: str
+    keys: dict
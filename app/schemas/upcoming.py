@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
+from uuid import UUID
 from app.models.upcoming import AvailabilityStatus
 
 
@@ -27,13 +28,12 @@ class SubmitAvailabilityRequest(BaseModel):
 
 
 class PlayerAvailabilityResponse(BaseModel):
-    id: str
+    id: UUID
     player_name: str
     status: AvailabilityStatus
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AvailabilitySummary(BaseModel):
@@ -44,7 +44,7 @@ class AvailabilitySummary(BaseModel):
 
 
 class UpcomingMatchResponse(BaseModel):
-    id: str
+    id: UUID
     opponent_name: str
     match_date: datetime
     venue: Optional[str]
@@ -54,17 +54,15 @@ class UpcomingMatchResponse(BaseModel):
     updated_at: datetime
     availability_summary: Optional[AvailabilitySummary] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UpcomingMatchListItem(BaseModel):
-    id: str
+    id: UUID
     opponent_name: str
     match_date: datetime
     venue: Optional[str]
     overs: Optional[int]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
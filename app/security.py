@@ -1,16 +1,30 @@
 import bcrypt
+import hmac
 import logging
+import time
 from fastapi import Header, HTTPException, status
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+PIN_CACHE_TTL = 300  # seconds
+
+# A short PIN has little entropy to protect, so a high bcrypt cost only adds
+# latency to every protected request
+PIN_HASH_ROUNDS = 8
+
+# HMAC(hash, pin) -> expiry (monotonic). Only successful checks are cached,
+# so the cache holds at most one live entry per configured PIN.
+_pin_cache: dict = {}
+
 
 def hash_pin(pin: str) -> str:
     """Hash PIN with bcrypt"""
     if not pin or len(pin) < 4:
         raise ValueError("PIN must be at least 4 characters long")
-    return bcrypt.hashpw(pin.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(pin.encode("utf-8"), bcrypt.gensalt(rounds=PIN_HASH_ROUNDS)).decode("utf-8")
 
 
 def verify_pin(plain_pin: str, hashed_pin: str) -> bool:
@@ -18,16 +32,22 @@ def verify_pin(plain_pin: str, hashed_pin: str) -> bool:
     if not hashed_pin or not plain_pin:
         logger.warning("PIN verification failed: missing PIN or hash")
         return False
+    key = hmac.new(hashed_pin.encode("utf-8"), plain_pin.encode("utf-8"), "sha256").digest()
+    now = time.monotonic()
+    if _pin_cache.get(key, 0) > now:
+        return True
     try:
-        return bcrypt.checkpw(plain_pin.encode("utf-8"), hashed_pin.encode("utf-8"))
+        valid = bcrypt.checkpw(plain_pin.encode("utf-8"), hashed_pin.encode("utf-8"))
     except Exception as e:
         logger.error(f"PIN verification error: {e}")
         return False
+    if valid:
+        _pin_cache[key] = now + PIN_CACHE_TTL
+    return valid
 
 
 def require_manager_pin(x_manager_pin: str = Header(..., alias="X-Manager-PIN")):
     """Require valid manager PIN"""
-    settings = get_settings()
     if not verify_pin(x_manager_pin, settings.MANAGER_PIN_HASH):
         logger.warning("Invalid manager PIN attempt")
         raise HTTPException(
@@ -39,7 +59,6 @@ def require_manager_pin(x_manager_pin: str = Header(..., alias="X-Manager-PIN"))
 
 def require_scorer_pin(x_scorer_pin: str = Header(..., alias="X-Scorer-PIN")):
     """Require valid scorer PIN"""
-    settings = get_settings()
     if not verify_pin(x_scorer_pin, settings.SCORER_PIN_HASH):
         logger.warning("Invalid scorer PIN attempt")
         raise HTTPException(
@@ -1,10 +1,12 @@
 from typing import List
+from uuid import UUID
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, case
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 
+from app.database import dialect_insert
 from app.models.finance import FinancePeriod, FinanceEntry, EntryType
 from app.schemas.finance import (
     CreateFinancePeriodRequest, UpdateFinancePeriodRequest,
@@ -13,54 +15,61 @@ from app.schemas.finance import (
     OverallFinanceSummary,
 )
 
+# Income/expense totals in integer cents, for use over a FinanceEntry join
+INCOME_CENTS = func.coalesce(func.sum(case(
+    (FinanceEntry.entry_type == EntryType.INCOME, FinanceEntry.amount_cents),
+    else_=0,
+)), 0)
+EXPENSE_CENTS = func.coalesce(func.sum(case(
+    (FinanceEntry.entry_type == EntryType.EXPENSE, FinanceEntry.amount_cents),
+    else_=0,
+)), 0)
+
 
 class FinanceService:
 
     @staticmethod
     async def create_period(db: AsyncSession, req: CreateFinancePeriodRequest) -> FinancePeriod:
-        stmt = select(FinancePeriod).where(
-            FinancePeriod.year == req.year,
-            FinancePeriod.month == req.month,
+        # Single race-free round-trip: a duplicate (year, month) inserts nothing
+        stmt = (
+            dialect_insert(FinancePeriod)
+            .values(
+                label=req.label.strip(),
+                year=req.year,
+                month=req.month,
+                notes=req.notes,
+            )
+            .on_conflict_do_nothing(index_elements=["year", "month"])
+            .returning(FinancePeriod)
         )
         result = await db.execute(stmt)
-        if result.scalar_one_or_none():
+        period = result.scalar_one_or_none()
+        if period is None:
             raise HTTPException(status_code=400, detail="A finance period for this month/year already exists.")
-
-        period = FinancePeriod(
-            label=req.label.strip(),
-            year=req.year,
-            month=req.month,
-            notes=req.notes,
-        )
-        db.add(period)
         await db.commit()
-        await db.refresh(period)
         return period
 
     @staticmethod
-    async def update_period(db: AsyncSession, period_id: str, req: UpdateFinancePeriodRequest) -> FinancePeriod:
+    async def update_period(db: AsyncSession, period_id: UUID, req: UpdateFinancePeriodRequest) -> FinancePeriod:
         period = await FinanceService._get_period(db, period_id)
         if req.label is not None:
             period.label = req.label.strip()
         if req.notes is not None:
             period.notes = req.notes
         await db.commit()
-        await db.refresh(period)
         return period
 
     @staticmethod
-    async def delete_period(db: AsyncSession, period_id: str) -> None:
+    async def delete_period(db: AsyncSession, period_id: UUID) -> None:
         period = await FinanceService._get_period(db, period_id)
         await db.delete(period)
         await db.commit()
 
     @staticmethod
-    async def _get_period(db: AsyncSession, period_id: str) -> FinancePeriod:
-        stmt = (
-            select(FinancePeriod)
-            .options(selectinload(FinancePeriod.entries))
-            .where(FinancePeriod.id == period_id)
-        )
+    async def _get_period(db: AsyncSession, period_id: UUID, load_entries: bool = False) -> FinancePeriod:
+        stmt = select(FinancePeriod).where(FinancePeriod.id == period_id)
+        if load_entries:
+            stmt = stmt.options(selectinload(FinancePeriod.entries))
         result = await db.execute(stmt)
         period = result.scalar_one_or_none()
         if not period:
@@ -68,8 +77,8 @@ class FinanceService:
         return period
 
     @staticmethod
-    async def get_period_with_summary(db: AsyncSession, period_id: str) -> FinancePeriodResponse:
-        period = await FinanceService._get_period(db, period_id)
+    async def get_period_with_summary(db: AsyncSession, period_id: UUID) -> FinancePeriodResponse:
+        period = await FinanceService._get_period(db, period_id, load_entries=True)
         summary = FinanceService._calculate_period_summary(period.entries)
         resp = FinancePeriodResponse.model_validate(period)
         resp.summary = summary
@@ -77,55 +86,80 @@ class FinanceService:
 
     @staticmethod
     async def list_periods(db: AsyncSession) -> List[FinancePeriodListItem]:
-        stmt = (
-            select(FinancePeriod)
-            .options(selectinload(FinancePeriod.entries))
+        # Totals are summed in the database over integer cents in a separate
+        # grouped query on finance_entries, so period rows aren't widened by
+        # the join and no entries are loaded
+        periods_stmt = (
+            select(
+                FinancePeriod.id,
+                FinancePeriod.label,
+                FinancePeriod.year,
+                FinancePeriod.month,
+                FinancePeriod.created_at,
+            )
             .order_by(FinancePeriod.year.desc(), FinancePeriod.month.desc())
         )
-        result = await db.execute(stmt)
-        periods = result.scalars().all()
+        totals_stmt = (
+            select(FinanceEntry.period_id, INCOME_CENTS, EXPENSE_CENTS)
+            .group_by(FinanceEntry.period_id)
+        )
+        periods = (await db.execute(periods_stmt)).all()
+        totals = {
+            period_id: (income_cents, expense_cents)
+            for period_id, income_cents, expense_cents in (await db.execute(totals_stmt)).all()
+        }
         items = []
+        # Rows come straight from the database, so skip revalidating them
         for p in periods:
-            summary = FinanceService._calculate_period_summary(p.entries)
-            item = FinancePeriodListItem.model_validate(p)
-            item.summary = summary
-            items.append(item)
+            items.append(FinancePeriodListItem.model_construct(
+                id=p.id,
+                label=p.label,
+                year=p.year,
+                month=p.month,
+                created_at=p.created_at,
+                summary=FinanceService._summary_from_cents(*totals.get(p.id, (0, 0))),
+            ))
         return items
 
     @staticmethod
     async def get_overall_summary(db: AsyncSession) -> OverallFinanceSummary:
+        result = await db.execute(select(INCOME_CENTS, EXPENSE_CENTS))
+        totals = FinanceService._summary_from_cents(*result.one())
         periods = await FinanceService.list_periods(db)
-        total_income = Decimal("0.00")
-        total_expense = Decimal("0.00")
-        for p in periods:
-            if p.summary:
-                total_income += p.summary.total_income
-                total_expense += p.summary.total_expense
         return OverallFinanceSummary(
+            total_income=totals.total_income,
+            total_expense=totals.total_expense,
+            remaining_balance=totals.remaining_balance,
+            periods=periods,
+        )
+
+    @staticmethod
+    def _summary_from_cents(income_cents, expense_cents) -> PeriodSummary:
+        total_income = Decimal(int(income_cents)).scaleb(-2)
+        total_expense = Decimal(int(expense_cents)).scaleb(-2)
+        return PeriodSummary(
             total_income=total_income,
             total_expense=total_expense,
             remaining_balance=total_income - total_expense,
-            periods=periods,
         )
 
     @staticmethod
     def _calculate_period_summary(entries: List[FinanceEntry]) -> PeriodSummary:
-        total_income = Decimal("0.00")
-        total_expense = Decimal("0.00")
+        # Fold integer cents; convert to Decimal once at the end
+        income_cents = 0
+        expense_cents = 0
         for e in entries:
             if e.entry_type == EntryType.INCOME:
-                total_income += e.amount
+                income_cents += e.amount_cents
             else:
-                total_expense += e.amount
-        return PeriodSummary(
-            total_income=total_income,
-            total_expense=total_expense,
-            remaining_balance=total_income - total_expense,
-        )
+                expense_cents += e.amount_cents
+        return FinanceService._summary_from_cents(income_cents, expense_cents)
 
     @staticmethod
-    async def add_entry(db: AsyncSession, period_id: str, req: CreateFinanceEntryRequest) -> FinanceEntry:
-        await FinanceService._get_period(db, period_id)
+    async def add_entry(db: AsyncSession, period_id: UUID, req: CreateFinanceEntryRequest) -> FinanceEntry:
+        result = await db.execute(select(FinancePeriod.id).where(FinancePeriod.id == period_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Finance period not found.")
         entry = FinanceEntry(
             period_id=period_id,
             entry_type=req.entry_type,
@@ -136,11 +170,10 @@ class FinanceService:
         )
         db.add(entry)
         await db.commit()
-        await db.refresh(entry)
         return entry
 
     @staticmethod
-    async def update_entry(db: AsyncSession, entry_id: str, req: UpdateFinanceEntryRequest) -> FinanceEntry:
+    async def update_entry(db: AsyncSession, entry_id: UUID, req: UpdateFinanceEntryRequest) -> FinanceEntry:
         stmt = select(FinanceEntry).where(FinanceEntry.id == entry_id)
         result = await db.execute(stmt)
         entry = result.scalar_one_or_none()
@@ -157,11 +190,10 @@ class FinanceService:
         if req.date is not None:
             entry.date = req.date
         await db.commit()
-        await db.refresh(entry)
         return entry
 
     @staticmethod
-    async def delete_entry(db: AsyncSession, entry_id: str) -> None:
+    async def delete_entry(db: AsyncSession, entry_id: UUID) -> None:
         stmt = select(FinanceEntry).where(FinanceEntry.id == entry_id)
         result = await db.execute(stmt)
         entry = result.scalar_one_or_none()
@@ -1,7 +1,17 @@
+"""Match scoring and scorecard queries.
+
+Every method runs its statements sequentially on the request's AsyncSession.
+A session is not safe for concurrent use, so never asyncio.gather() queries
+on the same session: fold related reads into one statement (selectinload,
+GROUP BY aggregates) instead.
+"""
+from dataclasses import dataclass
 from typing import List, Optional
+from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, update, func, case, or_
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException, status
 
 from app.models.match import (
@@ -15,10 +25,102 @@ from app.schemas.match import (
 )
 
 
+# Membership sets shared by record_ball and the scorecard queries
+ILLEGAL_DELIVERIES = frozenset({ExtraType.WIDE, ExtraType.NO_BALL})
+NON_BATSMAN_EXTRAS = frozenset({ExtraType.WIDE, ExtraType.BYE, ExtraType.LEG_BYE})
+NON_BOWLER_EXTRAS = frozenset({ExtraType.BYE, ExtraType.LEG_BYE})
+NON_BOWLER_DISMISSALS = frozenset({DismissalType.RUN_OUT, DismissalType.RETIRED_HURT, DismissalType.OBSTRUCTING})
+FINISHED_MATCH_STATUSES = frozenset({MatchStatus.COMPLETED, MatchStatus.ABANDONED})
+
+# How-out format by (dismissal type, fielder recorded), resolved once at import.
+# Unlisted combinations fall back to the caught format with a fielder and the
+# dismissal name without one.
+DISMISSAL_FMT = {
+    **{(dt, True): "c {fielder} b {bowler}" for dt in (*DismissalType, None)},
+    **{(dt, False): dt.value if dt else "out" for dt in (*DismissalType, None)},
+    (DismissalType.BOWLED, True): "b {bowler}",
+    (DismissalType.BOWLED, False): "b {bowler}",
+    (DismissalType.LBW, True): "lbw b {bowler}",
+    (DismissalType.LBW, False): "lbw b {bowler}",
+    (DismissalType.CAUGHT, False): "c & b {bowler}",
+    (DismissalType.RUN_OUT, True): "run out ({fielder})",
+    (DismissalType.RUN_OUT, False): "run out",
+    (DismissalType.STUMPED, True): "st {fielder} b {bowler}",
+    (DismissalType.HIT_WICKET, False): "hit wicket b {bowler}",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BallState:
+    """Scoring position of an innings between deliveries"""
+    current_over: int
+    current_ball: int
+    total_runs: int
+    total_wickets: int
+
+
+@dataclass(frozen=True, slots=True)
+class BallTransition:
+    state: BallState
+    rotate_strike: bool
+    over_complete: bool
+    innings_ended: bool
+
+
+@dataclass(slots=True)
+class BatsmanTally:
+    runs: int = 0
+    balls_faced: int = 0
+    fours: int = 0
+    sixes: int = 0
+    how_out: str = "not out"
+    bowler: Optional[str] = None
+
+
+def advance_ball_state(
+    state: BallState,
+    runs_scored: int,
+    extra_runs: int,
+    extra_type: ExtraType,
+    is_wicket: bool,
+    total_overs: int,
+    target: Optional[int],
+) -> BallTransition:
+    """Advance the over/ball count, strike and end-of-innings checks for one delivery"""
+    is_legal = extra_type not in ILLEGAL_DELIVERIES
+    current_over, current_ball = state.current_over, state.current_ball
+    total_runs = state.total_runs + runs_scored + extra_runs
+    total_wickets = state.total_wickets + 1 if is_wicket else state.total_wickets
+
+    if is_legal:
+        current_ball += 1
+        rotate_strike = runs_scored % 2 == 1
+    else:
+        rotate_strike = extra_type == ExtraType.NO_BALL and runs_scored % 2 == 1
+
+    over_complete = is_legal and current_ball >= 6
+    if over_complete:
+        current_ball = 0
+        current_over += 1
+        rotate_strike = not rotate_strike
+
+    innings_ended = (
+        total_wickets >= 10
+        or (current_over >= total_overs and current_ball == 0)
+        or bool(target and total_runs >= target)
+    )
+    return BallTransition(
+        BallState(current_over, current_ball, total_runs, total_wickets),
+        rotate_strike,
+        over_complete,
+        innings_ended,
+    )
+
+
 class MatchService:
 
     @staticmethod
-    async def _get_innings_by_id(db: AsyncSession, innings_id: str) -> Innings:
+    async def _get_innings_by_id(db: AsyncSession, innings_id: UUID) -> Innings:
         stmt = (
             select(Innings)
             .options(selectinload(Innings.balls))
@@ -32,27 +134,24 @@ class MatchService:
 
     @staticmethod
     async def create_match(db: AsyncSession, req: CreateMatchRequest) -> Match:
-        match = Match(
+        # INSERT ... RETURNING fills server defaults without a follow-up SELECT
+        stmt = insert(Match).values(
             team_a_name=req.team_a_name.strip(),
             team_b_name=req.team_b_name.strip(),
             total_overs=req.total_overs,
             venue=req.venue.strip() if req.venue else None,
             status=MatchStatus.TOSS,
-        )
-        db.add(match)
+        ).returning(Match)
+        match = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(match)
         return match
 
     @staticmethod
-    async def get_match(db: AsyncSession, match_id: str) -> Match:
-        stmt = (
-            select(Match)
-            .options(
-                selectinload(Match.innings).selectinload(Innings.balls)
-            )
-            .where(Match.id == match_id)
-        )
+    async def get_match(db: AsyncSession, match_id: UUID, load_balls: bool = True) -> Match:
+        innings_loader = selectinload(Match.innings)
+        if load_balls:
+            innings_loader = innings_loader.selectinload(Innings.balls)
+        stmt = select(Match).options(innings_loader).where(Match.id == match_id)
         result = await db.execute(stmt)
         match = result.scalar_one_or_none()
         if not match:
@@ -60,27 +159,98 @@ class MatchService:
         return match
 
     @staticmethod
-    async def list_matches(db: AsyncSession) -> List[Match]:
-        stmt = select(Match).order_by(Match.created_at.desc())
+    async def _get_match_row(db: AsyncSession, match_id: UUID) -> Match:
+        """Load just the match row, for updates that don't touch innings or balls"""
+        stmt = select(Match).options(raiseload("*")).where(Match.id == match_id)
         result = await db.execute(stmt)
-        return list(result.scalars().all())
+        match = result.scalar_one_or_none()
+        if not match:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Match not found.")
+        return match
 
     @staticmethod
-    async def set_toss(db: AsyncSession, match_id: str, req: SetTossRequest) -> Match:
-        match = await MatchService.get_match(db, match_id)
-        if match.status != MatchStatus.TOSS:
-            raise HTTPException(status_code=400, detail="Toss can only be set when match is in TOSS state.")
-        if req.toss_winner not in (match.team_a_name, match.team_b_name):
+    async def _get_active_innings_row(db: AsyncSession, match_id: UUID, lock: bool = False) -> Innings:
+        """Load just the in-progress innings row of a match"""
+        stmt = (
+            select(Innings)
+            .options(raiseload("*"))
+            .where(Innings.match_id == match_id, Innings.status == InningsStatus.IN_PROGRESS)
+            .order_by(Innings.innings_number)
+        )
+        # FOR UPDATE serializes concurrent scorers on the same match (SQLite
+        # omits it; its writers are already serialized)
+        if lock:
+            stmt = stmt.with_for_update()
+        result = await db.execute(stmt)
+        innings = result.scalars().first()
+        if not innings:
+            await MatchService._get_match_row(db, match_id)
+            raise HTTPException(status_code=400, detail="No active innings found.")
+        return innings
+
+    @staticmethod
+    async def _update_active_innings(db: AsyncSession, match_id: UUID, *criteria, **values) -> Optional[Innings]:
+        """UPDATE ... RETURNING the in-progress innings; None if no row matched"""
+        stmt = (
+            update(Innings)
+            .where(Innings.match_id == match_id, Innings.status == InningsStatus.IN_PROGRESS, *criteria)
+            .values(**values)
+            .returning(Innings)
+        )
+        return (await db.execute(stmt)).scalars().first()
+
+    @staticmethod
+    async def list_matches(db: AsyncSession, limit: int = 100, offset: int = 0) -> List[MatchListItem]:
+        # Project only the list columns instead of hydrating Match objects
+        stmt = (
+            select(
+                Match.id,
+                Match.team_a_name,
+                Match.team_b_name,
+                Match.total_overs,
+                Match.venue,
+                Match.status,
+                Match.result_summary,
+                Match.created_at,
+            )
+            # created_at has one-second resolution; id keeps pages stable on ties
+            .order_by(Match.created_at.desc(), Match.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = (await db.execute(stmt)).mappings().all()
+        # Rows come straight from the database, so skip revalidating them
+        return [MatchListItem.model_construct(**row) for row in rows]
+
+    @staticmethod
+    async def set_toss(db: AsyncSession, match_id: UUID, req: SetTossRequest) -> Match:
+        # Preconditions live in the WHERE clause, so the check and write are atomic
+        stmt = (
+            update(Match)
+            .where(
+                Match.id == match_id,
+                Match.status == MatchStatus.TOSS,
+                or_(Match.team_a_name == req.toss_winner, Match.team_b_name == req.toss_winner),
+            )
+            .values(
+                toss_winner=req.toss_winner,
+                toss_decision=req.toss_decision,
+                status=MatchStatus.IN_PROGRESS,
+            )
+            .returning(Match)
+        )
+        match = (await db.execute(stmt)).scalar_one_or_none()
+        if match is None:
+            # Nothing updated; re-read only to report why
+            match = await MatchService._get_match_row(db, match_id)
+            if match.status != MatchStatus.TOSS:
+                raise HTTPException(status_code=400, detail="Toss can only be set when match is in TOSS state.")
             raise HTTPException(status_code=400, detail="Toss winner must be one of the two teams.")
-        match.toss_winner = req.toss_winner
-        match.toss_decision = req.toss_decision
-        match.status = MatchStatus.IN_PROGRESS
         await db.commit()
-        await db.refresh(match)
         return match
 
     @staticmethod
-    async def start_innings(db: AsyncSession, match_id: str, req: StartInningsRequest) -> Innings:
+    async def start_innings(db: AsyncSession, match_id: UUID, req: StartInningsRequest) -> Innings:
         match = await MatchService.get_match(db, match_id)
         if match.status not in (MatchStatus.IN_PROGRESS, MatchStatus.INNINGS_BREAK):
             raise HTTPException(status_code=400, detail="Cannot start innings in current match state.")
@@ -103,7 +273,7 @@ class MatchService:
             first_innings = match.innings[0]
             target = first_innings.total_runs + 1
 
-        innings = Innings(
+        stmt = insert(Innings).values(
             match_id=match_id,
             innings_number=innings_number,
             batting_team=req.batting_team.strip(),
@@ -113,15 +283,21 @@ class MatchService:
             striker_name=req.striker_name.strip(),
             non_striker_name=req.non_striker_name.strip(),
             current_bowler_name=req.bowler_name.strip(),
-        )
-        db.add(innings)
+        ).returning(Innings)
+        innings = (await db.execute(stmt)).scalar_one()
+        # A new innings has no balls; mark the collection loaded instead of re-selecting
+        set_committed_value(innings, "balls", [])
         match.status = MatchStatus.IN_PROGRESS
         await db.commit()
-        return await MatchService._get_innings_by_id(db, innings.id)
+        return innings
 
     @staticmethod
-    async def _get_active_innings(db: AsyncSession, match_id: str) -> tuple:
-        match = await MatchService.get_match(db, match_id)
+    async def _get_active_innings(db: AsyncSession, match_id: UUID, lock: bool = False) -> tuple:
+        if lock:
+            # Take the row lock before reading the match so every counter
+            # read below is the committed, locked value
+            await MatchService._get_active_innings_row(db, match_id, lock=True)
+        match = await MatchService.get_match(db, match_id, load_balls=False)
         active_innings = None
         for inn in match.innings:
             if inn.status == InningsStatus.IN_PROGRESS:
@@ -132,9 +308,8 @@ class MatchService:
         return match, active_innings
 
     @staticmethod
-    async def record_ball(db: AsyncSession, match_id: str, req: RecordBallRequest) -> dict:
-        match, innings = await MatchService._get_active_innings(db, match_id)
-
+    def _apply_ball(db: AsyncSession, match: Match, innings: Innings, req: RecordBallRequest) -> dict:
+        """Validate one delivery, add its BallEvent and advance the innings/match state"""
         if req.is_wicket and not req.dismissal_type:
             raise HTTPException(status_code=400, detail="Dismissal type is required for a wicket.")
         if req.is_wicket and not req.dismissed_batsman:
@@ -142,10 +317,10 @@ class MatchService:
         if req.is_boundary_four and req.is_boundary_six:
             raise HTTPException(status_code=400, detail="Ball cannot be both four and six.")
 
-        is_legal = req.extra_type not in (ExtraType.WIDE, ExtraType.NO_BALL)
+        is_legal = req.extra_type not in ILLEGAL_DELIVERIES
 
-        active_balls = [b for b in innings.balls if not b.is_undone]
-        sequence_number = len(active_balls) + 1
+        innings.active_ball_count += 1
+        sequence_number = innings.active_ball_count
 
         ball_event = BallEvent(
             innings_id=innings.id,
@@ -168,9 +343,6 @@ class MatchService:
         )
         db.add(ball_event)
 
-        total_runs_this_ball = req.runs_scored + req.extra_runs
-        innings.total_runs += total_runs_this_ball
-
         if req.extra_type == ExtraType.WIDE:
             innings.extras_wides += req.extra_runs
         elif req.extra_type == ExtraType.NO_BALL:
@@ -180,27 +352,25 @@ class MatchService:
         elif req.extra_type == ExtraType.LEG_BYE:
             innings.extras_leg_byes += req.extra_runs
 
-        if req.is_wicket:
-            innings.total_wickets += 1
-
-        should_rotate_strike = False
+        transition = advance_ball_state(
+            BallState(innings.current_over, innings.current_ball, innings.total_runs, innings.total_wickets),
+            req.runs_scored,
+            req.extra_runs,
+            req.extra_type,
+            req.is_wicket,
+            match.total_overs,
+            innings.target if innings.innings_number == 2 else None,
+        )
+        new_state = transition.state
+        innings.current_over = new_state.current_over
+        innings.current_ball = new_state.current_ball
+        innings.total_runs = new_state.total_runs
+        innings.total_wickets = new_state.total_wickets
         if is_legal:
-            innings.current_ball += 1
-            if req.runs_scored % 2 == 1:
-                should_rotate_strike = True
-        else:
-            if req.extra_type == ExtraType.NO_BALL and req.runs_scored % 2 == 1:
-                should_rotate_strike = True
-
-        over_complete = False
-        if is_legal and innings.current_ball >= 6:
-            innings.current_ball = 0
-            innings.current_over += 1
-            innings.total_overs_bowled = float(innings.current_over)
-            over_complete = True
-            should_rotate_strike = not should_rotate_strike
-        elif is_legal:
-            innings.total_overs_bowled = float(innings.current_over) + (innings.current_ball / 10.0)
+            innings.total_overs_bowled = new_state.current_over + new_state.current_ball / 10.0
+        should_rotate_strike = transition.rotate_strike
+        over_complete = transition.over_complete
+        innings_ended = transition.innings_ended
 
         if should_rotate_strike:
             innings.striker_name, innings.non_striker_name = innings.non_striker_name, innings.striker_name
@@ -217,20 +387,9 @@ class MatchService:
                 else:
                     innings.non_striker_name = req.new_batsman_name.strip()
 
-        innings_ended = False
         result_summary = None
-
-        if innings.total_wickets >= 10:
-            innings.status = InningsStatus.COMPLETED
-            innings_ended = True
-        elif innings.current_over >= match.total_overs and innings.current_ball == 0:
-            innings.status = InningsStatus.COMPLETED
-            innings_ended = True
-        elif innings.innings_number == 2 and innings.target and innings.total_runs >= innings.target:
-            innings.status = InningsStatus.COMPLETED
-            innings_ended = True
-
         if innings_ended:
+            innings.status = InningsStatus.COMPLETED
             if innings.innings_number == 1:
                 match.status = MatchStatus.INNINGS_BREAK
             else:
@@ -238,9 +397,6 @@ class MatchService:
                 result_summary = MatchService._calculate_result(match, innings)
                 match.result_summary = result_summary
 
-        await db.commit()
-        await db.refresh(innings)
-
         return {
             "ball_event": ball_event,
             "innings": innings,
@@ -249,6 +405,30 @@ class MatchService:
             "result_summary": result_summary,
         }
 
+    @staticmethod
+    async def record_ball(db: AsyncSession, match_id: UUID, req: RecordBallRequest) -> dict:
+        match, innings = await MatchService._get_active_innings(db, match_id, lock=True)
+        result = MatchService._apply_ball(db, match, innings, req)
+        await db.commit()
+        return result
+
+    @staticmethod
+    async def record_balls_bulk(db: AsyncSession, match_id: UUID, reqs: List[RecordBallRequest]) -> dict:
+        """Record a sequence of deliveries in one transaction; any invalid ball rejects the batch"""
+        match, innings = await MatchService._get_active_innings(db, match_id, lock=True)
+        result = None
+        for i, req in enumerate(reqs):
+            if result is not None and result["innings_ended"]:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Innings ended at ball {i}; {len(reqs) - i} ball(s) not recorded.",
+                )
+            result = MatchService._apply_ball(db, match, innings, req)
+        await db.commit()
+        result["balls_recorded"] = len(reqs)
+        return result
+
+
     @staticmethod
     def _calculate_result(match: Match, second_innings: Innings) -> str:
         first_innings = match.innings[0]
@@ -260,14 +440,21 @@ class MatchService:
             return f"{first_innings.batting_team} won by {run_diff} run(s)"
 
     @staticmethod
-    async def undo_last_ball(db: AsyncSession, match_id: str) -> dict:
-        match, innings = await MatchService._get_active_innings(db, match_id)
-        active_balls = [b for b in innings.balls if not b.is_undone]
-        if not active_balls:
+    async def undo_last_ball(db: AsyncSession, match_id: UUID) -> dict:
+        match, innings = await MatchService._get_active_innings(db, match_id, lock=True)
+        stmt = (
+            select(BallEvent)
+            .where(BallEvent.innings_id == innings.id, BallEvent.is_undone.is_(False))
+            .order_by(BallEvent.sequence_number.desc())
+            .limit(1)
+        )
+        result = await db.execute(stmt)
+        last_ball = result.scalar_one_or_none()
+        if not last_ball:
             raise HTTPException(status_code=400, detail="No balls to undo.")
 
-        last_ball = active_balls[-1]
         last_ball.is_undone = True
+        innings.active_ball_count -= 1
 
         total_runs_this_ball = last_ball.runs_scored + last_ball.extra_runs
         innings.total_runs -= total_runs_this_ball
@@ -301,23 +488,30 @@ class MatchService:
         return {"message": "Last ball undone.", "innings": refreshed}
 
     @staticmethod
-    async def change_bowler(db: AsyncSession, match_id: str, req: ChangeBowlerRequest) -> Innings:
-        _, innings = await MatchService._get_active_innings(db, match_id)
-        if innings.current_ball != 0:
+    async def change_bowler(db: AsyncSession, match_id: UUID, req: ChangeBowlerRequest) -> Innings:
+        innings = await MatchService._update_active_innings(
+            db, match_id, Innings.current_ball == 0, current_bowler_name=req.bowler_name.strip()
+        )
+        if innings is None:
+            await MatchService._get_active_innings_row(db, match_id)
             raise HTTPException(status_code=400, detail="Bowler can only be changed at the start of an over.")
-        innings.current_bowler_name = req.bowler_name.strip()
         await db.commit()
         return await MatchService._get_innings_by_id(db, innings.id)
 
     @staticmethod
-    async def swap_strike(db: AsyncSession, match_id: str) -> Innings:
-        _, innings = await MatchService._get_active_innings(db, match_id)
-        innings.striker_name, innings.non_striker_name = innings.non_striker_name, innings.striker_name
+    async def swap_strike(db: AsyncSession, match_id: UUID) -> Innings:
+        # SET expressions read the pre-update row, so this swaps in place
+        innings = await MatchService._update_active_innings(
+            db, match_id, striker_name=Innings.non_striker_name, non_striker_name=Innings.striker_name
+        )
+        if innings is None:
+            await MatchService._get_active_innings_row(db, match_id)
+            raise HTTPException(status_code=400, detail="No active innings found.")
         await db.commit()
         return await MatchService._get_innings_by_id(db, innings.id)
 
     @staticmethod
-    async def end_innings(db: AsyncSession, match_id: str) -> Match:
+    async def end_innings(db: AsyncSession, match_id: UUID) -> Match:
         match, innings = await MatchService._get_active_innings(db, match_id)
         innings.status = InningsStatus.COMPLETED
         if innings.innings_number == 1:
@@ -329,158 +523,194 @@ class MatchService:
         return await MatchService.get_match(db, match_id)
 
     @staticmethod
-    async def abandon_match(db: AsyncSession, match_id: str) -> Match:
-        match = await MatchService.get_match(db, match_id)
+    async def abandon_match(db: AsyncSession, match_id: UUID) -> Match:
+        match = await MatchService._get_match_row(db, match_id)
         if match.status == MatchStatus.COMPLETED:
             raise HTTPException(status_code=400, detail="Cannot abandon a completed match.")
         match.status = MatchStatus.ABANDONED
         match.result_summary = "Match Abandoned"
-        for inn in match.innings:
-            if inn.status == InningsStatus.IN_PROGRESS:
-                inn.status = InningsStatus.COMPLETED
+        await db.execute(
+            update(Innings)
+            .where(Innings.match_id == match_id, Innings.status == InningsStatus.IN_PROGRESS)
+            .values(status=InningsStatus.COMPLETED)
+        )
         await db.commit()
         return await MatchService.get_match(db, match_id)
 
     @staticmethod
-    async def delete_match(db: AsyncSession, match_id: str) -> None:
-        match = await MatchService.get_match(db, match_id)
-        if match.status not in (MatchStatus.COMPLETED, MatchStatus.ABANDONED):
+    async def delete_match(db: AsyncSession, match_id: UUID) -> None:
+        match = await MatchService._get_match_row(db, match_id)
+        if match.status not in FINISHED_MATCH_STATUSES:
             raise HTTPException(status_code=400, detail="Only completed or abandoned matches can be deleted.")
         await db.delete(match)
         await db.commit()
 
     @staticmethod
-    async def get_scorecard(db: AsyncSession, match_id: str) -> FullScorecard:
-        match = await MatchService.get_match(db, match_id)
+    def _describe_dismissal(dismissal_type: Optional[DismissalType], fielder_name: Optional[str], bowler_name: str) -> str:
+        fmt = DISMISSAL_FMT[(dismissal_type, bool(fielder_name))]
+        return fmt.format(bowler=bowler_name, fielder=fielder_name)
+
+    @staticmethod
+    async def get_scorecard(db: AsyncSession, match_id: UUID) -> FullScorecard:
+        match = await MatchService.get_match(db, match_id, load_balls=False)
         match_info = MatchListItem.model_validate(match)
+        innings_ids = [inn.id for inn in match.innings]
+
+        # Per-player figures are rolled up by the database, one query per
+        # table shape for all innings, instead of hydrating every ball
+        active = (BallEvent.innings_id.in_(innings_ids), BallEvent.is_undone.is_(False))
+        legal = case((BallEvent.is_legal_delivery, 1), else_=0)
+
+        batting_stmt = (
+            select(
+                BallEvent.innings_id,
+                BallEvent.batsman_name,
+                func.min(BallEvent.sequence_number).label("first_seq"),
+                func.sum(case(
+                    (BallEvent.extra_type.in_(NON_BATSMAN_EXTRAS), 0),
+                    else_=BallEvent.runs_scored,
+                )).label("runs"),
+                func.sum(case(
+                    (or_(BallEvent.is_legal_delivery, BallEvent.extra_type == ExtraType.NO_BALL), 1),
+                    else_=0,
+                )).label("balls_faced"),
+                func.sum(case((BallEvent.is_boundary_four, 1), else_=0)).label("fours"),
+                func.sum(case((BallEvent.is_boundary_six, 1), else_=0)).label("sixes"),
+            )
+            .where(*active)
+            .group_by(BallEvent.innings_id, BallEvent.batsman_name)
+        )
+        bowling_stmt = (
+            select(
+                BallEvent.innings_id,
+                BallEvent.bowler_name,
+                func.min(BallEvent.sequence_number).label("first_seq"),
+                func.sum(legal).label("balls"),
+                func.sum(case(
+                    (BallEvent.extra_type == ExtraType.WIDE, BallEvent.extra_runs),
+                    (BallEvent.extra_type == ExtraType.NO_BALL, BallEvent.extra_runs + BallEvent.runs_scored),
+                    (BallEvent.extra_type.in_(NON_BOWLER_EXTRAS), 0),
+                    else_=BallEvent.runs_scored,
+                )).label("runs_conceded"),
+                func.sum(case(
+                    (
+                        BallEvent.is_wicket & or_(
+                            BallEvent.dismissal_type.is_(None),
+                            BallEvent.dismissal_type.not_in(NON_BOWLER_DISMISSALS),
+                        ),
+                        1,
+                    ),
+                    else_=0,
+                )).label("wickets"),
+                func.sum(case((BallEvent.extra_type == ExtraType.WIDE, 1), else_=0)).label("wides"),
+                func.sum(case((BallEvent.extra_type == ExtraType.NO_BALL, 1), else_=0)).label("no_balls"),
+            )
+            .where(*active)
+            .group_by(BallEvent.innings_id, BallEvent.bowler_name)
+        )
+        # A maiden is a completed over (six legal balls) with nothing scored
+        maiden_overs = (
+            select(BallEvent.innings_id, BallEvent.bowler_name)
+            .where(*active)
+            .group_by(BallEvent.innings_id, BallEvent.bowler_name, BallEvent.over_number)
+            .having(
+                func.sum(legal) == 6,
+                func.sum(BallEvent.runs_scored + BallEvent.extra_runs) == 0,
+            )
+            .subquery()
+        )
+        maidens_stmt = (
+            select(maiden_overs.c.innings_id, maiden_overs.c.bowler_name, func.count())
+            .group_by(maiden_overs.c.innings_id, maiden_overs.c.bowler_name)
+        )
+        wickets_stmt = (
+            select(
+                BallEvent.innings_id,
+                BallEvent.sequence_number,
+                BallEvent.over_number,
+                BallEvent.ball_number,
+                BallEvent.bowler_name,
+                BallEvent.dismissal_type,
+                BallEvent.dismissed_batsman,
+                BallEvent.fielder_name,
+            )
+            .where(*active, BallEvent.is_wicket)
+            .order_by(BallEvent.innings_id, BallEvent.sequence_number)
+        )
+
+        batting_rows = {}
+        bowling_rows = {}
+        wicket_rows = {}
+        maidens = {}
+        if innings_ids:
+            for row in (await db.execute(batting_stmt)).all():
+                batting_rows.setdefault(row.innings_id, []).append(row)
+            for row in (await db.execute(bowling_stmt)).all():
+                bowling_rows.setdefault(row.innings_id, []).append(row)
+            for innings_id, bowler_name, count in (await db.execute(maidens_stmt)).all():
+                maidens[(innings_id, bowler_name)] = count
+            for row in (await db.execute(wickets_stmt)).all():
+                if row.dismissed_batsman:
+                    wicket_rows.setdefault(row.innings_id, []).append(row)
 
         innings_cards = []
         for inn in match.innings:
-            active_balls = [b for b in inn.balls if not b.is_undone]
+            # Batsmen are listed in order of first appearance, either on
+            # strike or as the dismissed batsman
+            order = {}
             batsmen_map = {}
-            bowler_map = {}
-            fow = []
-
-            for ball in active_balls:
-                bname = ball.batsman_name
-                if bname not in batsmen_map:
-                    batsmen_map[bname] = {
-                        "runs": 0, "balls_faced": 0, "fours": 0, "sixes": 0,
-                        "how_out": "not out", "bowler": None
-                    }
-                if ball.is_legal_delivery or ball.extra_type == ExtraType.NO_BALL:
-                    batsmen_map[bname]["balls_faced"] += 1
-                if ball.extra_type not in (ExtraType.WIDE, ExtraType.BYE, ExtraType.LEG_BYE):
-                    batsmen_map[bname]["runs"] += ball.runs_scored
-                if ball.is_boundary_four:
-                    batsmen_map[bname]["fours"] += 1
-                if ball.is_boundary_six:
-                    batsmen_map[bname]["sixes"] += 1
-
-                if ball.is_wicket and ball.dismissed_batsman:
-                    d = ball.dismissed_batsman
-                    if d not in batsmen_map:
-                        batsmen_map[d] = {
-                            "runs": 0, "balls_faced": 0, "fours": 0, "sixes": 0,
-                            "how_out": "not out", "bowler": None
-                        }
-                    dismissal_str = ball.dismissal_type.value if ball.dismissal_type else "out"
-                    if ball.fielder_name:
-                        dismissal_str = f"c {ball.fielder_name} b {ball.bowler_name}"
-                        if ball.dismissal_type == DismissalType.BOWLED:
-                            dismissal_str = f"b {ball.bowler_name}"
-                        elif ball.dismissal_type == DismissalType.LBW:
-                            dismissal_str = f"lbw b {ball.bowler_name}"
-                        elif ball.dismissal_type == DismissalType.RUN_OUT:
-                            dismissal_str = f"run out ({ball.fielder_name})"
-                        elif ball.dismissal_type == DismissalType.STUMPED:
-                            dismissal_str = f"st {ball.fielder_name} b {ball.bowler_name}"
-                    else:
-                        if ball.dismissal_type == DismissalType.BOWLED:
-                            dismissal_str = f"b {ball.bowler_name}"
-                        elif ball.dismissal_type == DismissalType.LBW:
-                            dismissal_str = f"lbw b {ball.bowler_name}"
-                        elif ball.dismissal_type == DismissalType.CAUGHT:
-                            dismissal_str = f"c & b {ball.bowler_name}"
-                        elif ball.dismissal_type == DismissalType.HIT_WICKET:
-                            dismissal_str = f"hit wicket b {ball.bowler_name}"
-                        elif ball.dismissal_type == DismissalType.RUN_OUT:
-                            dismissal_str = "run out"
-                    batsmen_map[d]["how_out"] = dismissal_str
-                    batsmen_map[d]["bowler"] = ball.bowler_name
-                    running_total = inn.total_runs  # simplified
-                    fow.append({
-                        "wicket_number": len(fow) + 1,
-                        "batsman": d,
-                        "score": f"{ball.over_number}.{ball.ball_number}",
-                    })
-
-                bowler = ball.bowler_name
-                if bowler not in bowler_map:
-                    bowler_map[bowler] = {
-                        "balls": 0, "maidens": 0, "runs_conceded": 0,
-                        "wickets": 0, "wides": 0, "no_balls": 0,
-                        "current_over_runs": 0, "current_over_balls": 0,
-                        "current_over_num": ball.over_number,
-                    }
-                bm = bowler_map[bowler]
-                if ball.is_legal_delivery:
-                    bm["balls"] += 1
-                    bm["current_over_balls"] += 1
-                if ball.extra_type == ExtraType.WIDE:
-                    bm["wides"] += 1
-                    bm["runs_conceded"] += ball.extra_runs
-                elif ball.extra_type == ExtraType.NO_BALL:
-                    bm["no_balls"] += 1
-                    bm["runs_conceded"] += ball.extra_runs + ball.runs_scored
-                elif ball.extra_type in (ExtraType.BYE, ExtraType.LEG_BYE):
-                    pass
-                else:
-                    bm["runs_conceded"] += ball.runs_scored
+            for row in batting_rows.get(inn.id, []):
+                order[row.batsman_name] = row.first_seq * 2
+                batsmen_map[row.batsman_name] = BatsmanTally(row.runs, row.balls_faced, row.fours, row.sixes)
 
-                if ball.is_wicket and ball.dismissal_type not in (DismissalType.RUN_OUT, DismissalType.RETIRED_HURT, DismissalType.OBSTRUCTING):
-                    bm["wickets"] += 1
-
-                bm["current_over_runs"] += ball.runs_scored + ball.extra_runs
-                if ball.over_number != bm["current_over_num"]:
-                    if bm["current_over_runs"] == 0 and bm["current_over_balls"] == 6:
-                        bm["maidens"] += 1
-                    bm["current_over_runs"] = 0
-                    bm["current_over_balls"] = 0
-                    bm["current_over_num"] = ball.over_number
+            fow = []
+            for row in wicket_rows.get(inn.id, []):
+                d = row.dismissed_batsman
+                tally = batsmen_map.get(d)
+                if tally is None:
+                    tally = batsmen_map[d] = BatsmanTally()
+                order[d] = min(order.get(d, row.sequence_number * 2 + 1), row.sequence_number * 2 + 1)
+                tally.how_out = MatchService._describe_dismissal(
+                    row.dismissal_type, row.fielder_name, row.bowler_name
+                )
+                tally.bowler = row.bowler_name
+                fow.append({
+                    "wicket_number": len(fow) + 1,
+                    "batsman": d,
+                    "score": f"{row.over_number}.{row.ball_number}",
+                })
 
             non_striker = inn.non_striker_name
             if non_striker and non_striker not in batsmen_map:
-                batsmen_map[non_striker] = {
-                    "runs": 0, "balls_faced": 0, "fours": 0, "sixes": 0,
-                    "how_out": "not out", "bowler": None
-                }
+                batsmen_map[non_striker] = BatsmanTally()
+                order[non_striker] = float("inf")
 
             batsmen_stats = []
-            for name, data in batsmen_map.items():
-                sr = (data["runs"] / data["balls_faced"] * 100) if data["balls_faced"] > 0 else 0.0
+            for name in sorted(batsmen_map, key=order.__getitem__):
+                data = batsmen_map[name]
+                sr = (data.runs / data.balls_faced * 100) if data.balls_faced > 0 else 0.0
                 batsmen_stats.append(BatsmanStats(
-                    name=name, runs=data["runs"], balls_faced=data["balls_faced"],
-                    fours=data["fours"], sixes=data["sixes"],
+                    name=name, runs=data.runs, balls_faced=data.balls_faced,
+                    fours=data.fours, sixes=data.sixes,
                     strike_rate=round(sr, 2),
-                    how_out=data["how_out"], bowler=data["bowler"]
+                    how_out=data.how_out, bowler=data.bowler
                 ))
 
             bowler_stats = []
-            for name, data in bowler_map.items():
-                overs_int = data["balls"] // 6
-                overs_rem = data["balls"] % 6
+            for data in sorted(bowling_rows.get(inn.id, []), key=lambda r: r.first_seq):
+                overs_int = data.balls // 6
+                overs_rem = data.balls % 6
                 overs_str = f"{overs_int}.{overs_rem}" if overs_rem else str(overs_int)
-                econ = (data["runs_conceded"] / (data["balls"] / 6)) if data["balls"] > 0 else 0.0
+                econ = (data.runs_conceded / (data.balls / 6)) if data.balls > 0 else 0.0
                 bowler_stats.append(BowlerStats(
-                    name=name,
+                    name=data.bowler_name,
                     overs=overs_str,
-                    maidens=data["maidens"],
-                    runs_conceded=data["runs_conceded"],
-                    wickets=data["wickets"],
+                    maidens=maidens.get((inn.id, data.bowler_name), 0),
+                    runs_conceded=data.runs_conceded,
+                    wickets=data.wickets,
                     economy=round(econ, 2),
-                    wides=data["wides"],
-                    no_balls=data["no_balls"],
+                    wides=data.wides,
+                    no_balls=data.no_balls,
                 ))
 
             overs_int = int(inn.total_overs_bowled)
@@ -500,7 +730,7 @@ class MatchService:
                     "byes": inn.extras_byes,
                     "leg_byes": inn.extras_leg_byes,
                     "penalties": inn.extras_penalties,
-                    "total": inn.extras_wides + inn.extras_no_balls + inn.extras_byes + inn.extras_leg_byes + inn.extras_penalties,
+                    "total": inn.extras_total,
                 },
                 batsmen=batsmen_stats,
                 bowlers=bowler_stats,
@@ -1,9 +1,12 @@
 from typing import List
+from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload, selectinload
 from fastapi import HTTPException, status
 
+from app.database import dialect_insert
 from app.models.upcoming import UpcomingMatch, PlayerAvailability, AvailabilityStatus
 from app.schemas.upcoming import (
     CreateUpcomingMatchRequest, UpdateUpcomingMatchRequest,
@@ -16,20 +19,19 @@ class UpcomingMatchService:
 
     @staticmethod
     async def create_match(db: AsyncSession, req: CreateUpcomingMatchRequest) -> UpcomingMatch:
-        match = UpcomingMatch(
+        stmt = insert(UpcomingMatch).values(
             opponent_name=req.opponent_name.strip(),
             match_date=req.match_date,
             venue=req.venue.strip() if req.venue else None,
             overs=req.overs,
             notes=req.notes,
-        )
-        db.add(match)
+        ).returning(UpcomingMatch)
+        match = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(match)
         return match
 
     @staticmethod
-    async def update_match(db: AsyncSession, match_id: str, req: UpdateUpcomingMatchRequest) -> UpcomingMatch:
+    async def update_match(db: AsyncSession, match_id: UUID, req: UpdateUpcomingMatchRequest) -> UpcomingMatch:
         match = await UpcomingMatchService.get_match(db, match_id)
         if req.opponent_name is not None:
             match.opponent_name = req.opponent_name.strip()
@@ -42,17 +44,16 @@ class UpcomingMatchService:
         if req.notes is not None:
             match.notes = req.notes
         await db.commit()
-        await db.refresh(match)
         return match
 
     @staticmethod
-    async def delete_match(db: AsyncSession, match_id: str) -> None:
+    async def delete_match(db: AsyncSession, match_id: UUID) -> None:
         match = await UpcomingMatchService.get_match(db, match_id)
         await db.delete(match)
         await db.commit()
 
     @staticmethod
-    async def get_match(db: AsyncSession, match_id: str) -> UpcomingMatch:
+    async def get_match(db: AsyncSession, match_id: UUID) -> UpcomingMatch:
         stmt = (
             select(UpcomingMatch)
             .options(selectinload(UpcomingMatch.availabilities))
@@ -71,61 +72,71 @@ class UpcomingMatchService:
         return list(result.scalars().all())
 
     @staticmethod
-    async def get_match_with_availability(db: AsyncSession, match_id: str) -> UpcomingMatchResponse:
-        match = await UpcomingMatchService.get_match(db, match_id)
-        summary = UpcomingMatchService._build_summary(match.availabilities)
-        resp = UpcomingMatchResponse.model_validate(match)
-        resp.availability_summary = summary
-        return resp
+    async def get_match_with_availability(db: AsyncSession, match_id: UUID) -> UpcomingMatchResponse:
+        # Status tallies are counted in SQL alongside the match row
+        status_counts = [
+            func.count(PlayerAvailability.id).filter(PlayerAvailability.status == s)
+            for s in (AvailabilityStatus.AVAILABLE, AvailabilityStatus.NOT_AVAILABLE, AvailabilityStatus.MAYBE)
+        ]
+        stmt = (
+            select(UpcomingMatch, *status_counts)
+            .outerjoin(PlayerAvailability, PlayerAvailability.upcoming_match_id == UpcomingMatch.id)
+            .options(raiseload("*"))
+            .where(UpcomingMatch.id == match_id)
+            .group_by(UpcomingMatch.id)
+        )
+        row = (await db.execute(stmt)).first()
+        if not row:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upcoming match not found.")
+        match, available, not_available, maybe = row
 
-    @staticmethod
-    def _build_summary(availabilities: List[PlayerAvailability]) -> AvailabilitySummary:
-        available = 0
-        not_available = 0
-        maybe = 0
-        players = []
-        for a in availabilities:
-            if a.status == AvailabilityStatus.AVAILABLE:
-                available += 1
-            elif a.status == AvailabilityStatus.NOT_AVAILABLE:
-                not_available += 1
-            elif a.status == AvailabilityStatus.MAYBE:
-                maybe += 1
-            players.append(PlayerAvailabilityResponse.model_validate(a))
-        return AvailabilitySummary(
+        players_stmt = select(
+            PlayerAvailability.id,
+            PlayerAvailability.player_name,
+            PlayerAvailability.status,
+            PlayerAvailability.created_at,
+        ).where(PlayerAvailability.upcoming_match_id == match_id)
+        players = (await db.execute(players_stmt)).all()
+
+        resp = UpcomingMatchResponse.model_validate(match)
+        resp.availability_summary = AvailabilitySummary(
             total_available=available,
             total_not_available=not_available,
             total_maybe=maybe,
-            players=players,
+            players=[PlayerAvailabilityResponse.model_validate(p) for p in players],
         )
+        return resp
 
     @staticmethod
     async def submit_availability(
-        db: AsyncSession, match_id: str, req: SubmitAvailabilityRequest
+        db: AsyncSession, match_id: UUID, req: SubmitAvailabilityRequest
     ) -> PlayerAvailability:
-        await UpcomingMatchService.get_match(db, match_id)
-
-        stmt = select(PlayerAvailability).where(
-            PlayerAvailability.upcoming_match_id == match_id,
-            PlayerAvailability.device_fingerprint == req.device_fingerprint,
+        # Atomic upsert keyed on (match, device); the FK rejects unknown matches
+        stmt = (
+            dialect_insert(PlayerAvailability)
+            .values(
+                upcoming_match_id=match_id,
+                player_name=req.player_name.strip(),
+                status=req.status,
+                device_fingerprint=req.device_fingerprint,
+            )
         )
-        result = await db.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            existing.player_name = req.player_name.strip()
-            existing.status = req.status
-            await db.commit()
-            await db.refresh(existing)
-            return existing
-
-        availability = PlayerAvailability(
-            upcoming_match_id=match_id,
-            player_name=req.player_name.strip(),
-            status=req.status,
-            device_fingerprint=req.device_fingerprint,
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=["upcoming_match_id", "device_fingerprint"],
+                set_={
+                    "player_name": stmt.excluded.player_name,
+                    "status": stmt.excluded.status,
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(PlayerAvailability)
+            .execution_options(populate_existing=True)
         )
-        db.add(availability)
+        try:
+            availability = (await db.execute(stmt)).scalar_one()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upcoming match not found.")
         await db.commit()
-        await db.refresh(availability)
         return availability
@@ -3,12 +3,21 @@ Utility to generate bcrypt-hashed PINs for Manager and Scorer roles.
 Run: python generate_pin.py
 Copy the output hashes into your .env file.
 """
-import bcrypt
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+from app import security
+
+# Defaults to app.security.PIN_HASH_ROUNDS; verification cost follows the
+# stored hash, so BCRYPT_ROUNDS lets operators tune it to their CPU
+PIN_HASH_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", security.PIN_HASH_ROUNDS))
 
 
 def hash_pin(pin: str) -> str:
-    return bcrypt.hashpw(pin.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(pin.encode("utf-8"), bcrypt.gensalt(rounds=PIN_HASH_ROUNDS)).decode("utf-8")
 
 
 if __name__ == "__main__":
@@ -24,8 +33,9 @@ if __name__ == "__main__":
         print("Scorer PIN cannot be empty.")
         sys.exit(1)
 
-    manager_hash = hash_pin(manager_pin)
-    scorer_hash = hash_pin(scorer_pin)
+    # The two hashes are independent and bcrypt releases the GIL
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        manager_hash, scorer_hash = ex.map(hash_pin, [manager_pin, scorer_pin])
 
     print(f"\n--- Add these to your .env file ---\n")
     print(f"MANAGER_PIN_HASH={manager_hash}")